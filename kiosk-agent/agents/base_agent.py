@@ -2,13 +2,16 @@
 기본 에이전트 클래스
 모든 에이전트의 베이스 클래스
 """
-from typing import List, Dict, Any, Optional
-import asyncio
-from openai import AsyncOpenAI
-from config.settings import settings
+from itertools import islice
+from typing import List, Dict, Any, Optional, Iterator, Callable, Tuple
+from config.settings import get_settings
+from llm_client import get_openai_client
 from memory.memory_manager import MemoryManager
 from utils.recovery import RecoveryManager, ErrorHandler
+from utils.rate_limiter import get_rate_limiter, estimate_tokens
+from utils.token_counter import MESSAGE_OVERHEAD_TOKENS
 from models.schemas import AgentResponse
+from models.message import ChatMessage
 
 
 class BaseAgent:
@@ -18,7 +21,8 @@ class BaseAgent:
         self,
         name: str = "BaseAgent",
         system_prompt: Optional[str] = None,
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        on_token: Optional[Callable[[str], None]] = None
     ):
         """
         에이전트 초기화
@@ -27,15 +31,18 @@ class BaseAgent:
             name: 에이전트 이름
             system_prompt: 시스템 프롬프트
             api_key: OpenAI API 키
+            on_token: 스트리밍 토큰 수신 콜백 (선택)
         """
         self.name = name
+        settings = get_settings()
         self.system_prompt = system_prompt or settings.system_prompt
+        self._system_message = {"role": "system", "content": self.system_prompt}
         
-        # OpenAI 클라이언트 초기화
-        self.client = AsyncOpenAI(
-            api_key=api_key or settings.openai_api_key
-        )
+        # OpenAI 클라이언트 (프로세스 전역 공유)
+        self.client = get_openai_client(api_key)
+        self.rate_limiter = get_rate_limiter()
         self.model = settings.openai_model
+        self.max_history_tokens = settings.max_history_tokens
         
         # 메모리 관리자
         self.memory = MemoryManager()
@@ -48,8 +55,9 @@ class BaseAgent:
         # 에러 핸들러
         self.error_handler = ErrorHandler()
         
-        # 대화 기록
-        self.conversation_history: List[Dict[str, str]] = []
+        # 스트리밍 출력
+        self.on_token = on_token
+        self._streamed_parts: List[str] = []
     
     async def process(
         self,
@@ -67,18 +75,13 @@ class BaseAgent:
             에이전트 응답
         """
         try:
-            # 메모리에 사용자 메시지 추가
+            self._streamed_parts.clear()
+            
+            # 대화 기록에 추가 (Mem0 저장은 백그라운드에서 처리)
             await self.memory.add_message("user", user_input, user_id)
-            self.conversation_history.append({
-                "role": "user",
-                "content": user_input
-            })
             
             # LLM 호출 (재시도 로직 포함)
-            success, result = await self.recovery.retry_async(
-                self._call_llm,
-                user_input
-            )
+            success, result = await self.recovery.retry_async(self._call_llm, user_input)
             
             if not success:
                 error_info = self.error_handler.handle_api_error(result)
@@ -90,16 +93,13 @@ class BaseAgent:
             
             response_message = result
             
-            # 메모리에 응답 추가
+            # 대화 기록에 응답 추가
             await self.memory.add_message("assistant", response_message, user_id)
-            self.conversation_history.append({
-                "role": "assistant",
-                "content": response_message
-            })
             
             return AgentResponse(
                 message=response_message,
-                success=True
+                success=True,
+                streamed=self._was_streamed(response_message)
             )
             
         except Exception as e:
@@ -120,22 +120,144 @@ class BaseAgent:
         Returns:
             LLM 응답
         """
-        # 메시지 준비
-        messages = [
-            {"role": "system", "content": self.system_prompt}
-        ]
+        # 메시지 준비 (시스템 메시지 + 최근 대화 기록)
+        messages = self._build_messages()
         
-        # 최근 대화 기록 추가 (최대 10개)
-        recent_history = self.conversation_history[-10:]
-        messages.extend(recent_history)
+        # LLM 스트리밍 호출 (temperature 제거)
+        content, _ = await self._stream_completion(messages)
+        return content
+    
+    async def _stream_completion(
+        self,
+        messages: List[Dict[str, Any]],
+        **kwargs
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """
+        LLM 스트리밍 호출
         
-        # LLM 호출 (temperature 제거)
-        response = await self.client.chat.completions.create(
-            model=self.model,
-            messages=messages
-        )
+        텍스트 토큰은 도착하는 대로 on_token 콜백에 전달하고,
+        도구 호출은 인덱스별로 조각을 이어 붙여 완성된 형태로 반환합니다.
+        요청은 공유 스케줄러를 거쳐 계정 한도(RPM/TPM) 안에서 실행됩니다.
+        
+        Args:
+            messages: 요청 메시지 리스트
+            **kwargs: 추가 요청 인자 (tools 등)
+            
+        Returns:
+            (응답 텍스트, 도구 호출 리스트)
+        """
+        parts: List[str] = []
+        tool_calls: Dict[int, Dict[str, Any]] = {}
+        self._start_stream_round()
+        
+        estimated = estimate_tokens(messages, kwargs.get("tools"))
+        async with self.rate_limiter.reserve(estimated) as reservation:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                stream=True,
+                stream_options={"include_usage": True},
+                **kwargs
+            )
+            
+            async for chunk in stream:
+                # 마지막 청크에만 사용량이 담겨 옴
+                if chunk.usage:
+                    reservation.used_tokens = chunk.usage.total_tokens
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                
+                if delta.content:
+                    parts.append(delta.content)
+                    self._emit(delta.content)
+                
+                for tool_call in delta.tool_calls or ():
+                    entry = tool_calls.setdefault(tool_call.index, {
+                        "id": "",
+                        "type": "function",
+                        "function": {"name": "", "arguments": ""}
+                    })
+                    if tool_call.id:
+                        entry["id"] = tool_call.id
+                    if tool_call.function:
+                        if tool_call.function.name:
+                            entry["function"]["name"] += tool_call.function.name
+                        if tool_call.function.arguments:
+                            entry["function"]["arguments"] += tool_call.function.arguments
+        
+        return "".join(parts), [tool_calls[i] for i in sorted(tool_calls)]
+    
+    def _start_stream_round(self):
+        """
+        새 응답 스트림 시작 (재시도, 도구 호출 라운드마다 호출)
+        
+        이전 시도나 도구 호출 전 라운드에서 이미 출력한 텍스트가 있으면
+        줄을 바꿔 이어 쓰지 않도록 하고, 최종 응답 비교 대상에서 제외합니다.
+        """
+        if self._streamed_parts:
+            self.on_token("\n")
+            self._streamed_parts.clear()
+    
+    def _emit(self, text: str):
+        """
+        스트리밍 텍스트 전달
         
-        return response.choices[0].message.content
+        Args:
+            text: 출력할 텍스트 조각
+        """
+        if self.on_token and text:
+            self._streamed_parts.append(text)
+            self.on_token(text)
+    
+    def _was_streamed(self, message: str) -> bool:
+        """
+        최종 응답이 스트리밍으로 그대로 출력되었는지 확인
+        
+        마지막 스트림 라운드에서 출력한 내용과 최종 응답을 비교합니다.
+        (고정 안내 메시지처럼) 출력된 내용과 최종 응답이 다르면 False를 반환해
+        호출하는 쪽에서 응답 전체를 다시 출력하도록 합니다.
+        
+        Args:
+            message: 최종 응답 메시지
+            
+        Returns:
+            스트리밍 출력 여부
+        """
+        return bool(self._streamed_parts) and "".join(self._streamed_parts) == message
+    
+    def _build_messages(self) -> List[Dict[str, Any]]:
+        """
+        LLM 요청 메시지 구성
+        
+        미리 만들어 둔 시스템 메시지 뒤에 최근 대화 기록을 한 번에 펼쳐 담습니다.
+        대화 기록은 전송 시점에만 딕셔너리로 변환합니다.
+        
+        Returns:
+            요청 메시지 리스트
+        """
+        return [self._system_message, *(msg.to_openai() for msg in self._recent_history())]
+    
+    def _recent_history(self) -> Iterator[ChatMessage]:
+        """
+        최근 대화 기록 조회 (토큰 예산 내, 복사 없이 순회)
+        
+        가장 최근 메시지부터 거슬러 올라가며 토큰 수를 더해
+        max_history_tokens를 넘기 직전까지의 기록만 포함합니다.
+        가장 최근 메시지는 예산을 넘더라도 항상 포함합니다.
+        
+        Returns:
+            최근 대화 기록 이터레이터
+        """
+        history = self.memory.history
+        start = len(history)
+        used = 0
+        for message in reversed(history):
+            used += message.tokens + MESSAGE_OVERHEAD_TOKENS
+            if used > self.max_history_tokens and start < len(history):
+                break
+            start -= 1
+        return islice(history, start, None)
     
     async def reset(self, user_id: Optional[str] = None):
         """
@@ -144,7 +266,6 @@ class BaseAgent:
         Args:
             user_id: 사용자 ID
         """
-        self.conversation_history = []
         await self.memory.clear_history(user_id)
     
     def get_conversation_history(self) -> List[Dict[str, str]]:
@@ -154,7 +275,7 @@ class BaseAgent:
         Returns:
             대화 기록 리스트
         """
-        return self.conversation_history
+        return self.memory.get_local_history()
     
     async def get_context_summary(self, user_id: Optional[str] = None) -> str:
         """
@@ -2,25 +2,43 @@
 주문 에이전트 모듈
 햄버거 주문을 처리하는 메인 에이전트
 """
-from typing import List, Dict, Any, Optional
-import json
-from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple, Callable
+import asyncio
+import re
+import orjson
 from agents.base_agent import BaseAgent
-from tools.menu_tools import MenuTools, MENU_TOOL_DEFINITIONS
+from models.menu import menu_db
+from tools.menu_tools import MenuTools, MENU_TOOL_DEFINITIONS, MENU_TOOL_NAMES
 from tools.order_tools import OrderTools, ORDER_TOOL_DEFINITIONS
 from utils.validation import OrderValidator, InputSanitizer
 from models.schemas import AgentResponse
 
 
+# 전체 도구 정의 (모든 에이전트 인스턴스가 공유)
+_TOOL_DEFINITIONS = MENU_TOOL_DEFINITIONS + ORDER_TOOL_DEFINITIONS
+
+# 주문 상태를 변경하지 않아 동시에 실행해도 안전한 도구 (메뉴 조회 도구)
+_READ_ONLY_TOOLS = MENU_TOOL_NAMES
+
+# LLM 없이 바로 처리하는 단순 명령 ("메뉴", "메뉴 보여줘", "확인", "주문 내역" 등)
+_MENU_RE = re.compile(r"^\s*메뉴(?:\s*(?:보여|알려)\s*(?:줘|주세요)|\s*(?:줘|주세요))?\s*[.!?~]*\s*$")
+_CONFIRM_RE = re.compile(r"^\s*(?:확인|주문\s*(?:내역|확인))\s*[.!?~]*\s*$")
+
+
 class OrderAgent(BaseAgent):
     """주문 처리 에이전트"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        on_token: Optional[Callable[[str], None]] = None
+    ):
         """
         주문 에이전트 초기화
         
         Args:
             api_key: OpenAI API 키
+            on_token: 스트리밍 토큰 수신 콜백 (선택)
         """
         system_prompt = """
         당신은 햄버거 가게의 친절한 주문 키오스크 AI 직원입니다.
@@ -43,7 +61,8 @@ class OrderAgent(BaseAgent):
         super().__init__(
             name="OrderAgent",
             system_prompt=system_prompt,
-            api_key=api_key
+            api_key=api_key,
+            on_token=on_token
         )
         
         # 도구 초기화
@@ -53,17 +72,29 @@ class OrderAgent(BaseAgent):
         self.sanitizer = InputSanitizer()
         
         # 모든 도구 정의
-        self.tools = MENU_TOOL_DEFINITIONS + ORDER_TOOL_DEFINITIONS
-    
-    @staticmethod
-    def _json_serializer(obj):
-        """
-        JSON 직렬화를 위한 커스텀 serializer
-        datetime 객체를 문자열로 변환
-        """
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        raise TypeError(f"Type {type(obj)} not serializable")
+        self.tools = _TOOL_DEFINITIONS
+        
+        # 도구 이름 -> 실행 함수 매핑
+        self._tool_dispatch = {
+            # 메뉴 도구
+            "get_menu_info": self.menu_tools.get_menu_info,
+            "get_all_menus": self.menu_tools.get_all_menus,
+            "get_menus_by_category": self.menu_tools.get_menus_by_category,
+            "search_menus": self.menu_tools.search_menus,
+            # 주문 도구
+            "add_item": self.order_tools.add_item,
+            "remove_item": self.order_tools.remove_item,
+            "get_current_order": self.order_tools.get_current_order,
+            "confirm_order": self.order_tools.confirm_order,
+            "add_special_request": self.order_tools.add_special_request,
+        }
+        
+        # 인자 없이 호출하는 도구
+        self._nullary_tools = frozenset({
+            "get_all_menus",
+            "get_current_order",
+            "confirm_order",
+        })
     
     async def process(
         self,
@@ -81,6 +112,8 @@ class OrderAgent(BaseAgent):
             에이전트 응답
         """
         try:
+            self._streamed_parts.clear()
+            
             # 입력 검증 및 정제
             validation_result = self.validator.validate_user_input(user_input)
             if not validation_result.is_valid:
@@ -94,18 +127,18 @@ class OrderAgent(BaseAgent):
             
             user_input = self.sanitizer.sanitize_text(user_input)
             
-            # 메모리에 추가
+            # 대화 기록에 추가 (Mem0 저장은 백그라운드에서 처리)
             await self.memory.add_message("user", user_input, user_id)
-            self.conversation_history.append({
-                "role": "user",
-                "content": user_input
-            })
             
-            # LLM 호출 (도구 사용 포함)
-            success, result = await self.recovery.retry_async(
-                self._call_llm_with_tools,
-                user_input
-            )
+            # 단순 조회 명령은 LLM 호출 없이 도구 결과로 바로 응답
+            local_response = self._answer_locally(user_input)
+            if local_response is not None:
+                success, result = True, local_response
+            else:
+                # LLM 호출 (도구 사용 포함)
+                success, result = await self.recovery.retry_async(
+                    self._call_llm_with_tools, user_input
+                )
             
             if not success:
                 error_info = self.error_handler.handle_api_error(result)
@@ -117,16 +150,13 @@ class OrderAgent(BaseAgent):
             
             response_message = result
             
-            # 메모리에 응답 추가
+            # 대화 기록에 응답 추가
             await self.memory.add_message("assistant", response_message, user_id)
-            self.conversation_history.append({
-                "role": "assistant",
-                "content": response_message
-            })
             
             return AgentResponse(
                 message=response_message,
-                success=True
+                success=True,
+                streamed=self._was_streamed(response_message)
             )
             
         except Exception as e:
@@ -137,6 +167,31 @@ class OrderAgent(BaseAgent):
                 error=str(e)
             )
     
+    def _answer_locally(self, user_input: str) -> Optional[str]:
+        """
+        단순 조회 명령 직접 처리
+        
+        "메뉴", "확인"처럼 의도가 명확한 입력은 LLM을 거치지 않고
+        도구를 직접 호출해 응답합니다.
+        
+        Args:
+            user_input: 정제된 사용자 입력
+            
+        Returns:
+            응답 메시지 (직접 처리할 수 없으면 None)
+        """
+        if _MENU_RE.match(user_input):
+            menus = menu_db.get_available_menus()
+            return f"전체 메뉴입니다.\n\n{self.menu_tools.format_menu_list(menus)}"
+        
+        if _CONFIRM_RE.match(user_input):
+            result = self.order_tools.get_current_order()
+            if not result["order"]:
+                return result["message"]
+            return f"{result['message']}\n\n{self.order_tools.format_order_summary()}"
+        
+        return None
+    
     async def _call_llm_with_tools(self, user_input: str) -> str:
         """
         도구 호출을 포함한 LLM 호출
@@ -147,77 +202,133 @@ class OrderAgent(BaseAgent):
         Returns:
             최종 응답 메시지
         """
-        # 메시지 준비
-        messages = [
-            {"role": "system", "content": self.system_prompt}
-        ]
-        
-        # 최근 대화 기록 추가
-        recent_history = self.conversation_history[-10:]
-        messages.extend(recent_history)
+        # 메시지 준비 (시스템 메시지 + 최근 대화 기록)
+        messages = self._build_messages()
         
         # 반복적으로 도구 호출 처리
         max_iterations = 5
         for iteration in range(max_iterations):
-            # LLM 호출 (temperature 제거)
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=messages,
+            # LLM 스트리밍 호출 (temperature 제거)
+            content, tool_calls = await self._stream_completion(
+                messages,
                 tools=self.tools,
                 tool_choice="auto"
             )
             
-            response_message = response.choices[0].message
-            
             # 도구 호출이 없으면 응답 반환
-            if not response_message.tool_calls:
-                return response_message.content
+            if not tool_calls:
+                return content
             
             # 메시지 히스토리에 어시스턴트 응답 추가
-            messages.append(response_message)
+            messages.append({
+                "role": "assistant",
+                "content": content or None,
+                "tool_calls": tool_calls
+            })
             
-            # 각 도구 호출 처리
-            for tool_call in response_message.tool_calls:
-                function_name = tool_call.function.name
-                
-                # JSON 파싱 시 인코딩 에러 처리
-                try:
-                    # arguments가 문자열인지 확인
-                    args_str = tool_call.function.arguments
-                    if isinstance(args_str, bytes):
-                        args_str = args_str.decode('utf-8', errors='ignore')
-                    
-                    function_args = json.loads(args_str)
-                except (json.JSONDecodeError, UnicodeDecodeError, AttributeError) as e:
-                    print(f"JSON 파싱 에러: {e}")
-                    print(f"원본 데이터: {tool_call.function.arguments}")
-                    # 기본값 사용
-                    function_args = {}
-                
-                # 도구 실행
-                try:
-                    function_response = self._execute_tool(
-                        function_name,
-                        function_args
-                    )
-                except Exception as e:
-                    print(f"도구 실행 에러 ({function_name}): {e}")
-                    function_response = {
-                        "success": False,
-                        "message": f"도구 실행 실패: {str(e)}"
-                    }
-                
-                # 도구 응답을 메시지에 추가
+            # 도구 호출 인자 파싱
+            calls = [
+                (
+                    tool_call["id"],
+                    tool_call["function"]["name"],
+                    self._parse_tool_arguments(tool_call["function"]["arguments"])
+                )
+                for tool_call in tool_calls
+            ]
+            
+            # 도구 실행 (독립적인 조회 도구는 동시에 실행)
+            results = await self._execute_tool_calls(
+                [(function_name, function_args) for _, function_name, function_args in calls]
+            )
+            
+            # 도구 응답을 호출 순서대로 메시지에 추가
+            for (tool_call_id, function_name, _), function_response in zip(calls, results):
                 messages.append({
-                    "tool_call_id": tool_call.id,
+                    "tool_call_id": tool_call_id,
                     "role": "tool",
                     "name": function_name,
-                    "content": json.dumps(function_response, ensure_ascii=False, default=self._json_serializer)
+                    "content": orjson.dumps(function_response).decode()
                 })
         
         # 최대 반복 도달 시 마지막 메시지 반환
         return "주문 처리 중 문제가 발생했습니다. 다시 시도해주세요."
     
+    @staticmethod
+    def _parse_tool_arguments(arguments: str) -> Dict[str, Any]:
+        """
+        도구 호출 인자 파싱
+        
+        Args:
+            arguments: JSON 형식의 인자 문자열
+            
+        Returns:
+            인자 딕셔너리 (파싱 실패 시 빈 딕셔너리)
+        """
+        # JSON 파싱 (orjson은 str/bytes를 모두 받음)
+        try:
+            return orjson.loads(arguments)
+        except orjson.JSONDecodeError as e:
+            print(f"JSON 파싱 에러: {e}")
+            print(f"원본 데이터: {arguments}")
+            # 기본값 사용
+            return {}
+    
+    async def _execute_tool_calls(
+        self,
+        calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Any]:
+        """
+        여러 도구 호출 실행
+        
+        조회 전용 도구는 서로 독립적이므로 스레드에서 동시에 실행하고,
+        주문 상태를 변경하는 도구는 호출 순서대로 실행합니다.
+        
+        Args:
+            calls: (함수 이름, 함수 인자) 리스트
+            
+        Returns:
+            호출 순서와 같은 순서의 실행 결과 리스트
+        """
+        results: List[Any] = [None] * len(calls)
+        
+        read_only = [i for i, (name, _) in enumerate(calls) if name in _READ_ONLY_TOOLS]
+        if len(read_only) > 1:
+            outputs = await asyncio.gather(*[
+                asyncio.to_thread(self._safe_execute_tool, *calls[i])
+                for i in read_only
+            ])
+            for i, output in zip(read_only, outputs):
+                results[i] = output
+            done = set(read_only)
+        else:
+            done = set()
+        
+        for i, (function_name, function_args) in enumerate(calls):
+            if i not in done:
+                results[i] = self._safe_execute_tool(function_name, function_args)
+        
+        return results
+    
+    def _safe_execute_tool(self, function_name: str, arguments: Dict[str, Any]) -> Any:
+        """
+        도구 실행 (에러 시 실패 응답 반환)
+        
+        Args:
+            function_name: 함수 이름
+            arguments: 함수 인자
+            
+        Returns:
+            함수 실행 결과 또는 실패 응답
+        """
+        try:
+            return self._execute_tool(function_name, arguments)
+        except Exception as e:
+            print(f"도구 실행 에러 ({function_name}): {e}")
+            return {
+                "success": False,
+                "message": f"도구 실행 실패: {str(e)}"
+            }
+    
     def _execute_tool(self, function_name: str, arguments: Dict[str, Any]) -> Any:
         """
         도구 실행
@@ -229,33 +340,16 @@ class OrderAgent(BaseAgent):
         Returns:
             함수 실행 결과
         """
-        # 메뉴 도구
-        if function_name == "get_menu_info":
-            return self.menu_tools.get_menu_info(**arguments)
-        elif function_name == "get_all_menus":
-            return self.menu_tools.get_all_menus()
-        elif function_name == "get_menus_by_category":
-            return self.menu_tools.get_menus_by_category(**arguments)
-        elif function_name == "search_menus":
-            return self.menu_tools.search_menus(**arguments)
-        
-        # 주문 도구
-        elif function_name == "add_item":
-            return self.order_tools.add_item(**arguments)
-        elif function_name == "remove_item":
-            return self.order_tools.remove_item(**arguments)
-        elif function_name == "get_current_order":
-            return self.order_tools.get_current_order()
-        elif function_name == "confirm_order":
-            return self.order_tools.confirm_order()
-        elif function_name == "add_special_request":
-            return self.order_tools.add_special_request(**arguments)
-        
-        else:
+        function = self._tool_dispatch.get(function_name)
+        if function is None:
             return {
                 "success": False,
                 "message": f"알 수 없는 함수: {function_name}"
             }
+        
+        if function_name in self._nullary_tools:
+            return function()
+        return function(**arguments)
     
     def get_current_order_info(self) -> Dict[str, Any]:
         """
@@ -273,16 +367,14 @@ class OrderAgent(BaseAgent):
         Returns:
             검증 결과
         """
-        order_info = self.order_tools.get_current_order()
-        if not order_info["success"] or not order_info["order"]:
+        order = self.order_tools.current_order
+        if not order or not order.items:
             return {
                 "is_valid": False,
                 "errors": ["주문이 비어있습니다"],
                 "warnings": []
             }
         
-        from models.schemas import Order
-        order = Order(**order_info["order"])
         validation_result = self.validator.validate_order(order)
         
         return validation_result.dict()
@@ -0,0 +1,4 @@
+# -*- coding: utf-8 -*-
+"""캐시 패키지"""
+
+__all__ = []
\ No newline at end of file
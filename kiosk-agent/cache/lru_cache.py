@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+LRU 캐시 모듈
+최근 사용 순서 기반의 크기 제한 캐시를 제공합니다.
+"""
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """크기 제한 LRU 캐시 클래스"""
+    
+    def __init__(self, maxsize: int = 1024):
+        """
+        캐시 초기화
+        
+        Args:
+            maxsize: 최대 항목 수
+        """
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+    
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        캐시 조회 (조회된 항목은 최근 사용으로 갱신)
+        
+        Args:
+            key: 캐시 키
+            default: 항목이 없을 때 반환할 값
+            
+        Returns:
+            캐시된 값 또는 기본값
+        """
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return default
+        return self._data[key]
+    
+    def put(self, key: Hashable, value: Any):
+        """
+        캐시 저장 (최대 크기 초과 시 가장 오래된 항목 제거)
+        
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+        """
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        캐시 항목 제거
+        
+        Args:
+            key: 캐시 키
+            default: 항목이 없을 때 반환할 값
+            
+        Returns:
+            제거된 값 또는 기본값
+        """
+        return self._data.pop(key, default)
+    
+    def clear(self):
+        """캐시 초기화"""
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
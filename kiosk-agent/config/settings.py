@@ -3,8 +3,9 @@
 설정 관리 모듈
 환경 변수 및 애플리케이션 설정을 관리합니다.
 """
-from pydantic_settings import BaseSettings
+from functools import lru_cache
 from typing import Optional
+from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
@@ -23,6 +24,18 @@ class Settings(BaseSettings):
     # 애플리케이션 설정
     max_retries: int = 3
     timeout_seconds: int = 30
+    max_history_tokens: int = 2000
+    
+    # HTTP 연결 풀 설정
+    http_max_connections: int = 64
+    http_max_connections_per_host: int = 32
+    http_keepalive_seconds: int = 120
+    http_connect_timeout_seconds: int = 10
+    
+    # LLM 요청 제한 설정 (에이전트 간 공유)
+    llm_max_concurrency: int = 32
+    llm_requests_per_minute: int = 500
+    llm_tokens_per_minute: int = 200000
     
     # 시스템 프롬프트
     system_prompt: str = """
@@ -36,5 +49,19 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
 
 
-# 전역 설정 인스턴스
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """
+    전역 설정 인스턴스 조회 (최초 호출 시 환경 변수 로드)
+    
+    Returns:
+        설정 인스턴스
+    """
+    return Settings()
+
+
+def __getattr__(name: str):
+    """기존 `from config.settings import settings` 사용처 호환"""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
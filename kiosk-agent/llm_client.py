@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+LLM 클라이언트 모듈
+프로세스 전역에서 공유하는 AsyncOpenAI 클라이언트를 관리합니다.
+"""
+from typing import Dict, Optional, TYPE_CHECKING
+from config.settings import get_settings
+
+if TYPE_CHECKING:
+    import aiohttp
+    from openai import AsyncOpenAI
+
+
+# API 키별 공유 클라이언트
+_clients: Dict[str, "AsyncOpenAI"] = {}
+
+
+def _create_session() -> "aiohttp.ClientSession":
+    """
+    연결 풀 설정이 적용된 aiohttp 세션 생성
+    
+    유휴 시간이 긴 키오스크에서도 TLS 연결이 재사용되도록
+    keep-alive 시간을 기본값(15초)보다 길게 설정합니다.
+    요청 타임아웃은 트랜스포트가 요청마다 SDK 설정값으로 덮어쓰므로
+    세션이 아니라 AsyncOpenAI 클라이언트에 지정합니다.
+    
+    Returns:
+        aiohttp 클라이언트 세션
+    """
+    import aiohttp
+    
+    settings = get_settings()
+    connector = aiohttp.TCPConnector(
+        limit=settings.http_max_connections,
+        limit_per_host=settings.http_max_connections_per_host,
+        keepalive_timeout=settings.http_keepalive_seconds,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+def get_openai_client(api_key: Optional[str] = None) -> "AsyncOpenAI":
+    """
+    공유 OpenAI 클라이언트 조회 (최초 호출 시 생성)
+
+    Args:
+        api_key: OpenAI API 키 (없으면 설정값 사용)
+
+    Returns:
+        AsyncOpenAI 클라이언트
+    """
+    settings = get_settings()
+    key = api_key or settings.openai_api_key
+    client = _clients.get(key)
+    if client is None:
+        # openai/aiohttp 임포트 비용은 첫 클라이언트 생성 시에만 지불
+        import httpx
+        from httpx_aiohttp import AiohttpTransport
+        from openai import AsyncOpenAI, DefaultAioHttpClient
+        
+        # 세션은 이벤트 루프 안에서 첫 요청 시 생성되도록 팩토리로 전달
+        client = AsyncOpenAI(
+            api_key=key,
+            timeout=httpx.Timeout(
+                settings.timeout_seconds,
+                connect=settings.http_connect_timeout_seconds
+            ),
+            http_client=DefaultAioHttpClient(
+                transport=AiohttpTransport(client=_create_session)
+            )
+        )
+        _clients[key] = client
+    return client
+
+
+async def shutdown_openai_client():
+    """공유 OpenAI 클라이언트 종료 (연결 풀 정리)"""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        try:
+            await client.close()
+        except Exception as e:
+            print(f"OpenAI 클라이언트 종료 실패: {e}")
@@ -4,7 +4,29 @@
 import asyncio
 from typing import Optional
 from agents.order_agent import OrderAgent
+from llm_client import shutdown_openai_client
 from models.schemas import AgentResponse
+from utils.token_counter import prewarm_encoding
+
+
+# 명령어 키워드
+_EXIT_KEYWORDS = frozenset(("종료", "끝", "exit", "quit", "bye"))
+_CANCEL_KEYWORDS = frozenset(("취소", "초기화", "처음부터", "cancel", "reset"))
+
+
+def _contains_keyword(user_input: str, keywords: frozenset) -> bool:
+    """
+    입력에 키워드가 포함되어 있는지 확인
+    
+    Args:
+        user_input: 사용자 입력
+        keywords: 키워드 집합
+        
+    Returns:
+        키워드 포함 여부
+    """
+    user_input = user_input.lower()
+    return any(keyword in user_input for keyword in keywords)
 
 
 class KioskInterface:
@@ -12,9 +34,10 @@ class KioskInterface:
     
     def __init__(self):
         """키오스크 초기화"""
-        self.agent = OrderAgent()
+        self.agent = OrderAgent(on_token=self._print_token)
         self.session_id = None
         self.is_running = False
+        self._streaming = False
     
     async def start(self):
         """키오스크 시작"""
@@ -31,6 +54,10 @@ class KioskInterface:
         print("\n자연스럽게 대화하듯이 주문하실 수 있습니다!")
         print("예: '클래식 버거 2개랑 콜라 주세요'\n")
         
+        # 첫 입력 전에 메뉴 조회 결과와 토큰 인코딩을 미리 준비
+        self.agent.menu_tools.prewarm_cache()
+        await asyncio.to_thread(prewarm_encoding)
+        
         await self._main_loop()
     
     async def _main_loop(self):
@@ -77,25 +104,37 @@ class KioskInterface:
             사용자 입력
         """
         try:
-            # asyncio에서 input 사용
-            loop = asyncio.get_event_loop()
-            user_input = await loop.run_in_executor(
-                None,
-                input,
-                "\n고객님: "
-            )
+            # 블로킹 input은 별도 스레드에서 실행
+            user_input = await asyncio.to_thread(input, "\n고객님: ")
             return user_input.strip()
         except EOFError:
             return ""
     
+    def _print_token(self, token: str):
+        """
+        스트리밍 토큰 출력
+        
+        Args:
+            token: 응답 텍스트 조각
+        """
+        if not self._streaming:
+            print("\n키오스크: ", end="")
+            self._streaming = True
+        print(token, end="", flush=True)
+    
     def _display_response(self, response: AgentResponse):
         """
-        응답 출력
+        응답 출력 (스트리밍으로 이미 출력된 메시지는 생략)
         
         Args:
             response: 에이전트 응답
         """
-        print(f"\n키오스크: {response.message}")
+        if self._streaming:
+            print()
+            self._streaming = False
+        
+        if not response.streamed:
+            print(f"\n키오스크: {response.message}")
         
         if not response.success and response.error:
             print(f"[오류 정보: {response.error}]")
@@ -115,8 +154,7 @@ class KioskInterface:
         Returns:
             종료 명령어 여부
         """
-        exit_keywords = ["종료", "끝", "exit", "quit", "bye"]
-        return any(keyword in user_input.lower() for keyword in exit_keywords)
+        return _contains_keyword(user_input, _EXIT_KEYWORDS)
     
     def _is_cancel_command(self, user_input: str) -> bool:
         """
@@ -128,15 +166,13 @@ class KioskInterface:
         Returns:
             취소 명령어 여부
         """
-        cancel_keywords = ["취소", "초기화", "처음부터", "cancel", "reset"]
-        return any(keyword in user_input.lower() for keyword in cancel_keywords)
+        return _contains_keyword(user_input, _CANCEL_KEYWORDS)
     
     async def _handle_exit(self):
         """종료 처리"""
         print("\n주문을 확정하시겠습니까? (예/아니오)")
         
-        loop = asyncio.get_event_loop()
-        confirm = await loop.run_in_executor(None, input, "답변: ")
+        confirm = await asyncio.to_thread(input, "답변: ")
         
         if confirm.strip().lower() in ["예", "yes", "y", "네"]:
             # 주문 확정
@@ -167,6 +203,7 @@ class KioskInterface:
 
 async def main():
     """메인 함수"""
+    kiosk = None
     try:
         kiosk = KioskInterface()
         await kiosk.start()
@@ -174,6 +211,13 @@ async def main():
         print(f"\n프로그램 실행 중 오류가 발생했습니다: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        # 남은 메모리 쓰기 처리
+        if kiosk is not None:
+            await kiosk.agent.memory.close()
+        
+        # 공유 HTTP 연결 정리
+        await shutdown_openai_client()
 
 
 if __name__ == "__main__":
@@ -3,9 +3,20 @@
 메모리 관리 모듈
 Mem0ai를 사용한 대화 기록 및 컨텍스트 관리
 """
-from typing import List, Dict, Any, Optional
-from mem0 import Memory
-from config.settings import settings
+import asyncio
+from collections import deque
+from itertools import islice
+from typing import List, Dict, Any, Optional, Deque, Tuple
+from config.settings import get_settings
+from models.message import ChatMessage
+from utils.text_index import NgramIndex
+
+
+# 로컬 대화 기록 최대 보관 수
+HISTORY_MAXLEN = 20
+
+# Mem0에 한 번에 저장할 최대 메시지 수
+WRITE_BATCH_SIZE = 16
 
 
 class MemoryManager:
@@ -18,10 +29,12 @@ class MemoryManager:
         Args:
             api_key: Mem0 API 키 (선택)
         """
-        self.api_key = api_key or settings.mem0_api_key
+        self.api_key = api_key or get_settings().mem0_api_key
         
-        # Mem0 메모리 초기화
+        # Mem0 메모리 초기화 (임베더/벡터 DB 로딩이 무거워 사용 시점에 임포트)
         try:
+            from mem0 import Memory
+            
             if self.api_key:
                 self.memory = Memory(api_key=self.api_key)
             else:
@@ -33,8 +46,17 @@ class MemoryManager:
             self.memory = None
             self.enabled = False
         
-        # 로컬 대화 기록 백업
-        self.conversation_history: List[Dict[str, str]] = []
+        # 로컬 대화 기록 (최근 기록만 보관, 에이전트가 LLM 요청에 직접 사용)
+        self.history: Deque[ChatMessage] = deque(maxlen=HISTORY_MAXLEN)
+        
+        # 로컬 검색용 색인 (일련번호, 소문자 내용, 메시지)
+        self._search_entries: Deque[Tuple[int, str, ChatMessage]] = deque()
+        self._search_index = NgramIndex()
+        self._next_seq = 0
+        
+        # Mem0 쓰기 큐 (첫 메시지 추가 시 백그라운드 작업 시작)
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
     
     async def add_message(self, role: str, content: str, 
                          user_id: Optional[str] = None) -> bool:
@@ -50,24 +72,94 @@ class MemoryManager:
             성공 여부
         """
         # 로컬 기록에 추가
-        self.conversation_history.append({
-            "role": role,
-            "content": content
-        })
+        self._append_local(role, content)
         
-        # Mem0에 저장
+        # Mem0 저장은 백그라운드 작업에 맡기고 바로 반환
         if self.enabled and self.memory:
+            self._ensure_writer()
+            self._write_queue.put_nowait((role, content, user_id or "default"))
+        
+        return True
+    
+    def _append_local(self, role: str, content: str):
+        """
+        로컬 대화 기록과 검색 색인에 메시지 추가
+        
+        Args:
+            role: 메시지 역할
+            content: 메시지 내용
+        """
+        # 가장 오래된 기록이 밀려나면 색인에서도 제거
+        if len(self.history) == HISTORY_MAXLEN:
+            seq, content_lower, _ = self._search_entries.popleft()
+            self._search_index.remove(seq, content_lower)
+        
+        message = ChatMessage(role, content)
+        self.history.append(message)
+        
+        seq = self._next_seq
+        self._next_seq += 1
+        content_lower = content.lower()
+        self._search_entries.append((seq, content_lower, message))
+        self._search_index.add(seq, content_lower)
+    
+    def _ensure_writer(self):
+        """Mem0 쓰기 작업이 실행 중인지 확인하고 필요하면 시작"""
+        if self._write_queue is None:
+            self._write_queue = asyncio.Queue()
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._drain_writes())
+    
+    async def _drain_writes(self):
+        """쓰기 큐에 쌓인 메시지를 묶어서 Mem0에 저장"""
+        queue = self._write_queue
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty() and len(batch) < WRITE_BATCH_SIZE:
+                batch.append(queue.get_nowait())
+            
             try:
-                self.memory.add(
-                    messages=[{"role": role, "content": content}],
-                    user_id=user_id or "default"
-                )
-                return True
+                await asyncio.to_thread(self._flush_batch, batch)
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    
+    def _flush_batch(self, batch: List[Tuple[str, str, str]]):
+        """
+        메시지 묶음을 사용자별로 Mem0에 저장 (동기)
+        
+        Args:
+            batch: (역할, 내용, 사용자 ID) 리스트
+        """
+        grouped: Dict[str, List[Dict[str, str]]] = {}
+        for role, content, user_id in batch:
+            grouped.setdefault(user_id, []).append({
+                "role": role,
+                "content": content
+            })
+        
+        for user_id, messages in grouped.items():
+            try:
+                self.memory.add(messages=messages, user_id=user_id)
             except Exception as e:
                 print(f"메모리 추가 실패: {e}")
-                return False
-        
-        return True
+    
+    async def flush_pending(self):
+        """대기 중인 Mem0 쓰기가 모두 끝날 때까지 대기"""
+        if (self._write_queue is not None and self._writer_task is not None
+                and not self._writer_task.done()):
+            await self._write_queue.join()
+    
+    async def close(self):
+        """대기 중인 쓰기를 마치고 백그라운드 작업 종료"""
+        await self.flush_pending()
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
     
     async def get_conversation_history(self, 
                                       user_id: Optional[str] = None,
@@ -84,7 +176,9 @@ class MemoryManager:
         """
         if self.enabled and self.memory:
             try:
-                memories = self.memory.get_all(
+                # Mem0는 블로킹 라이브러리이므로 스레드에서 실행
+                memories = await asyncio.to_thread(
+                    self.memory.get_all,
                     user_id=user_id or "default"
                 )
                 return memories[-limit:] if memories else []
@@ -92,7 +186,11 @@ class MemoryManager:
                 print(f"메모리 조회 실패: {e}")
         
         # 로컬 기록 반환
-        return self.conversation_history[-limit:]
+        history = self.history
+        return [
+            msg.to_openai()
+            for msg in islice(history, max(0, len(history) - limit), None)
+        ]
     
     async def search_memories(self, query: str, 
                              user_id: Optional[str] = None,
@@ -110,7 +208,8 @@ class MemoryManager:
         """
         if self.enabled and self.memory:
             try:
-                results = self.memory.search(
+                results = await asyncio.to_thread(
+                    self.memory.search,
                     query=query,
                     user_id=user_id or "default",
                     limit=limit
@@ -119,11 +218,16 @@ class MemoryManager:
             except Exception as e:
                 print(f"메모리 검색 실패: {e}")
         
-        # 로컬 검색 (간단한 키워드 매칭)
+        # 로컬 검색 (n-gram 색인으로 후보를 좁힌 뒤 키워드 매칭)
+        query_lower = query.lower()
+        candidates = self._search_index.candidates(query_lower)
+        
         results = []
-        for msg in self.conversation_history:
-            if query.lower() in msg.get("content", "").lower():
-                results.append(msg)
+        for seq, content_lower, msg in self._search_entries:
+            if candidates is not None and seq not in candidates:
+                continue
+            if query_lower in content_lower:
+                results.append(msg.to_openai())
                 if len(results) >= limit:
                     break
         
@@ -139,13 +243,21 @@ class MemoryManager:
         Returns:
             성공 여부
         """
+        # 대기 중인 쓰기가 삭제 이후에 반영되지 않도록 먼저 처리
+        await self.flush_pending()
+        
         # 로컬 기록 초기화
-        self.conversation_history = []
+        self.history.clear()
+        self._search_entries.clear()
+        self._search_index.clear()
         
         # Mem0 메모리 삭제
         if self.enabled and self.memory:
             try:
-                self.memory.delete_all(user_id=user_id or "default")
+                await asyncio.to_thread(
+                    self.memory.delete_all,
+                    user_id=user_id or "default"
+                )
                 return True
             except Exception as e:
                 print(f"메모리 삭제 실패: {e}")
@@ -184,7 +296,7 @@ class MemoryManager:
         Returns:
             대화 기록 리스트
         """
-        return self.conversation_history
+        return [msg.to_openai() for msg in self.history]
     
     def add_to_local_history(self, role: str, content: str):
         """
@@ -194,7 +306,4 @@ class MemoryManager:
             role: 메시지 역할
             content: 메시지 내용
         """
-        self.conversation_history.append({
-            "role": role,
-            "content": content
-        })
\ No newline at end of file
+        self._append_local(role, content)
\ No newline at end of file
@@ -3,16 +3,87 @@
 메뉴 데이터 관리 모듈
 햄버거 가게의 메뉴 정보를 관리합니다.
 """
-from typing import List, Dict, Optional
+import sys
+from dataclasses import replace
+from typing import List, Dict, Optional, Tuple, Any, Sequence, Set, Hashable, Iterable
 from models.schemas import MenuItem, MenuCategory
+from utils.text_index import NgramIndex
+
+
+def _intern_options(*options: str) -> Tuple[str, ...]:
+    """
+    옵션 문자열을 인터닝한 튜플 생성
+    
+    Args:
+        *options: 옵션 이름
+        
+    Returns:
+        인터닝된 옵션 튜플
+    """
+    return tuple(sys.intern(option) for option in options)
+
+
+# 메뉴 간 공유하는 옵션 튜플
+_BURGER_OPTIONS = _intern_options("치즈 추가", "베이컨 추가", "패티 추가")
+_CHEESE_BURGER_OPTIONS = _intern_options("베이컨 추가", "패티 추가", "치즈 추가")
+_SIZE_OPTIONS = _intern_options("사이즈 업그레이드")
+_COFFEE_OPTIONS = _intern_options("사이즈 업그레이드", "샷 추가")
+_NO_OPTIONS: Tuple[str, ...] = ()
+
+
+def _substring_scan(entries: Sequence[Tuple[str, str, MenuItem]], keyword_lower: str,
+                    candidates: Optional[Set[Hashable]]) -> List[MenuItem]:
+    """
+    부분 문자열 검색 (검색 핫 루프)
+    
+    메뉴 수가 적은 현재는 순수 파이썬 구현으로 충분합니다. 카탈로그가 매우 커지면
+    같은 시그니처의 벡터화 구현으로 MenuDatabase._scan만 교체하면 됩니다.
+    
+    Args:
+        entries: (소문자 이름, 소문자 설명, 메뉴) 목록
+        keyword_lower: 소문자 검색 키워드
+        candidates: 후보 메뉴 ID 집합 (None이면 전체 검색)
+        
+    Returns:
+        일치하는 메뉴 리스트 (등록 순서 유지)
+    """
+    return [
+        menu for name_lower, description_lower, menu in entries
+        if (candidates is None or menu.id in candidates)
+        and (keyword_lower in name_lower or keyword_lower in description_lower)
+    ]
 
 
 class MenuDatabase:
     """메뉴 데이터베이스 클래스"""
     
+    # 검색 구현 (교체 가능)
+    _scan = staticmethod(_substring_scan)
+    
     def __init__(self):
         """메뉴 데이터 초기화"""
         self.menus: Dict[str, MenuItem] = {}
+        
+        # 메뉴 데이터 버전 (색인을 다시 구성할 때마다 증가, 조회 결과 캐시 무효화용)
+        self.version = 0
+        
+        # 소문자 검색 색인 (소문자 이름, 소문자 설명, 메뉴)
+        self._lower_index: List[Tuple[str, str, MenuItem]] = []
+        
+        # 정확한 이름 조회 (소문자 이름 -> 메뉴)
+        self._exact_name: Dict[str, MenuItem] = {}
+        
+        # 키워드 검색용 n-gram 색인 (메뉴 ID 기준)
+        self._search_index = NgramIndex()
+        
+        # 도구 응답용 직렬화 결과 (메뉴 ID -> 딕셔너리)
+        self._dict_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # 전체/카테고리별/주문 가능 메뉴 (메뉴 변경 시에만 다시 구성)
+        self._all_menus: Tuple[MenuItem, ...] = ()
+        self._by_category: Dict[MenuCategory, Tuple[MenuItem, ...]] = {}
+        self._available: Tuple[MenuItem, ...] = ()
+        
         self._initialize_menus()
     
     def _initialize_menus(self):
@@ -25,7 +96,7 @@ class MenuDatabase:
                 category=MenuCategory.BURGER,
                 price=5900,
                 description="신선한 소고기 패티와 채소가 들어간 클래식 버거",
-                options=["치즈 추가", "베이컨 추가", "패티 추가"]
+                options=_BURGER_OPTIONS
             ),
             MenuItem(
                 id="B002",
@@ -33,7 +104,7 @@ class MenuDatabase:
                 category=MenuCategory.BURGER,
                 price=6900,
                 description="고소한 치즈가 듬뿍 들어간 치즈 버거",
-                options=["베이컨 추가", "패티 추가", "치즈 추가"]
+                options=_CHEESE_BURGER_OPTIONS
             ),
             MenuItem(
                 id="B003",
@@ -41,7 +112,7 @@ class MenuDatabase:
                 category=MenuCategory.BURGER,
                 price=7900,
                 description="바삭한 베이컨이 들어간 프리미엄 버거",
-                options=["치즈 추가", "베이컨 추가", "패티 추가"]
+                options=_BURGER_OPTIONS
             ),
             MenuItem(
                 id="B004",
@@ -49,7 +120,7 @@ class MenuDatabase:
                 category=MenuCategory.BURGER,
                 price=8900,
                 description="패티 2장이 들어간 푸짐한 버거",
-                options=["치즈 추가", "베이컨 추가", "패티 추가"]
+                options=_BURGER_OPTIONS
             ),
             
             # 사이드 메뉴
@@ -59,7 +130,7 @@ class MenuDatabase:
                 category=MenuCategory.SIDE,
                 price=2500,
                 description="바삭바삭한 황금 감자튀김",
-                options=["사이즈 업그레이드"]
+                options=_SIZE_OPTIONS
             ),
             MenuItem(
                 id="S002",
@@ -67,7 +138,7 @@ class MenuDatabase:
                 category=MenuCategory.SIDE,
                 price=3500,
                 description="쫄깃한 모차렐라 치즈스틱",
-                options=[]
+                options=_NO_OPTIONS
             ),
             MenuItem(
                 id="S003",
@@ -75,7 +146,7 @@ class MenuDatabase:
                 category=MenuCategory.SIDE,
                 price=3000,
                 description="바삭한 양파링",
-                options=[]
+                options=_NO_OPTIONS
             ),
             
             # 음료 메뉴
@@ -85,7 +156,7 @@ class MenuDatabase:
                 category=MenuCategory.DRINK,
                 price=2000,
                 description="시원한 콜라",
-                options=["사이즈 업그레이드"]
+                options=_SIZE_OPTIONS
             ),
             MenuItem(
                 id="D002",
@@ -93,7 +164,7 @@ class MenuDatabase:
                 category=MenuCategory.DRINK,
                 price=2000,
                 description="상큼한 사이다",
-                options=["사이즈 업그레이드"]
+                options=_SIZE_OPTIONS
             ),
             MenuItem(
                 id="D003",
@@ -101,7 +172,7 @@ class MenuDatabase:
                 category=MenuCategory.DRINK,
                 price=2500,
                 description="진한 아메리카노",
-                options=["사이즈 업그레이드", "샷 추가"]
+                options=_COFFEE_OPTIONS
             ),
             
             # 디저트 메뉴
@@ -111,7 +182,7 @@ class MenuDatabase:
                 category=MenuCategory.DESSERT,
                 price=2000,
                 description="부드러운 소프트 아이스크림",
-                options=[]
+                options=_NO_OPTIONS
             ),
             MenuItem(
                 id="DS002",
@@ -119,12 +190,65 @@ class MenuDatabase:
                 category=MenuCategory.DESSERT,
                 price=2500,
                 description="따뜻한 애플파이",
-                options=[]
+                options=_NO_OPTIONS
             ),
         ]
         
         for item in menu_items:
             self.menus[item.id] = item
+        
+        self._rebuild_indexes()
+    
+    def _rebuild_indexes(self):
+        """메뉴 데이터에서 파생되는 조회용 색인 재구성"""
+        self.version += 1
+        
+        # 조회마다 소문자 변환하지 않도록 미리 계산
+        self._lower_index = [
+            (menu.name.lower(), menu.description.lower(), menu)
+            for menu in self.menus.values()
+        ]
+        self._exact_name = {
+            name_lower: menu for name_lower, _, menu in self._lower_index
+        }
+        self._search_index.clear()
+        for name_lower, description_lower, menu in self._lower_index:
+            self._search_index.add(menu.id, f"{name_lower}\n{description_lower}")
+        
+        # 메뉴가 바뀔 때만 직렬화
+        self._dict_cache = {
+            menu_id: menu.to_dict() for menu_id, menu in self.menus.items()
+        }
+        
+        # 전체 메뉴, 카테고리별 메뉴와 주문 가능 메뉴
+        self._all_menus = tuple(self.menus.values())
+        by_category: Dict[MenuCategory, List[MenuItem]] = {}
+        for menu in self.menus.values():
+            by_category.setdefault(menu.category, []).append(menu)
+        self._by_category = {
+            category: tuple(menus) for category, menus in by_category.items()
+        }
+        self._available = tuple(menu for menu in self._all_menus if menu.available)
+    
+    def set_availability(self, menu_id: str, available: bool) -> bool:
+        """
+        메뉴 재고 상태 변경
+        
+        Args:
+            menu_id: 메뉴 ID
+            available: 재고 여부
+            
+        Returns:
+            변경 성공 여부 (메뉴가 없으면 False)
+        """
+        menu = self.menus.get(menu_id)
+        if menu is None:
+            return False
+        
+        if menu.available != available:
+            self.menus[menu_id] = replace(menu, available=available)
+            self._rebuild_indexes()
+        return True
     
     def get_menu_by_id(self, menu_id: str) -> Optional[MenuItem]:
         """
@@ -138,6 +262,44 @@ class MenuDatabase:
         """
         return self.menus.get(menu_id)
     
+    def get_menus_by_ids(self, menu_ids: Iterable[str]) -> Dict[str, MenuItem]:
+        """
+        여러 ID의 메뉴를 한 번에 조회
+    
+        Args:
+            menu_ids: 메뉴 ID 목록
+    
+        Returns:
+            {메뉴 ID: MenuItem} 딕셔너리 (없는 ID는 제외)
+        """
+        menus = self.menus
+        return {menu_id: menus[menu_id] for menu_id in menu_ids if menu_id in menus}
+    
+    def get_menu_dict(self, menu_id: str) -> Optional[Dict[str, Any]]:
+        """
+        메뉴 딕셔너리 조회 (미리 직렬화된 결과, 읽기 전용)
+        
+        Args:
+            menu_id: 메뉴 ID
+            
+        Returns:
+            메뉴 딕셔너리 또는 None
+        """
+        return self._dict_cache.get(menu_id)
+    
+    def get_menu_dicts(self, menus: Sequence[MenuItem]) -> List[Dict[str, Any]]:
+        """
+        메뉴 리스트를 딕셔너리 리스트로 변환 (미리 직렬화된 결과, 읽기 전용)
+        
+        Args:
+            menus: 메뉴 리스트
+            
+        Returns:
+            메뉴 딕셔너리 리스트
+        """
+        cache = self._dict_cache
+        return [cache[menu.id] for menu in menus]
+    
     def get_menu_by_name(self, name: str) -> Optional[MenuItem]:
         """
         이름으로 메뉴 조회 (부분 일치)
@@ -149,12 +311,18 @@ class MenuDatabase:
             MenuItem 또는 None
         """
         name_lower = name.lower()
-        for menu in self.menus.values():
-            if name_lower in menu.name.lower():
+        
+        # 전체 이름을 입력한 경우 바로 반환
+        menu = self._exact_name.get(name_lower)
+        if menu is not None:
+            return menu
+        
+        for menu_name_lower, _, menu in self._lower_index:
+            if name_lower in menu_name_lower:
                 return menu
         return None
     
-    def get_menus_by_category(self, category: MenuCategory) -> List[MenuItem]:
+    def get_menus_by_category(self, category: MenuCategory) -> Tuple[MenuItem, ...]:
         """
         카테고리별 메뉴 조회
         
@@ -162,27 +330,27 @@ class MenuDatabase:
             category: 메뉴 카테고리
             
         Returns:
-            MenuItem 리스트
+            MenuItem 튜플
         """
-        return [menu for menu in self.menus.values() if menu.category == category]
+        return self._by_category.get(category, ())
     
-    def get_all_menus(self) -> List[MenuItem]:
+    def get_all_menus(self) -> Tuple[MenuItem, ...]:
         """
         전체 메뉴 조회
         
         Returns:
-            MenuItem 리스트
+            MenuItem 튜플
         """
-        return list(self.menus.values())
+        return self._all_menus
     
-    def get_available_menus(self) -> List[MenuItem]:
+    def get_available_menus(self) -> Tuple[MenuItem, ...]:
         """
         재고가 있는 메뉴만 조회
         
         Returns:
-            MenuItem 리스트
+            MenuItem 튜플
         """
-        return [menu for menu in self.menus.values() if menu.available]
+        return self._available
     
     def search_menus(self, keyword: str) -> List[MenuItem]:
         """
@@ -195,12 +363,13 @@ class MenuDatabase:
             MenuItem 리스트
         """
         keyword_lower = keyword.lower()
-        results = []
-        for menu in self.menus.values():
-            if (keyword_lower in menu.name.lower() or 
-                keyword_lower in menu.description.lower()):
-                results.append(menu)
-        return results
+        
+        # n-gram 색인으로 후보를 좁힌 뒤 실제 포함 여부 확인 (메뉴 등록 순서 유지)
+        candidates = self._search_index.candidates(keyword_lower)
+        if candidates is not None and not candidates:
+            return []
+        
+        return self._scan(self._lower_index, keyword_lower, candidates)
 
 
 # 전역 메뉴 데이터베이스 인스턴스
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+대화 메시지 모듈
+대화 기록에 보관하는 경량 메시지 레코드를 정의합니다.
+"""
+from typing import Dict, Optional
+from utils.token_counter import count_tokens
+
+
+class ChatMessage:
+    """
+    대화 메시지
+    
+    역할과 내용만 담는 __slots__ 레코드로, 딕셔너리보다 메모리를 적게 사용합니다.
+    OpenAI 요청에 필요한 딕셔너리는 to_openai()로 전송 시점에만 만듭니다.
+    토큰 수는 처음 필요할 때 한 번만 계산해 보관합니다.
+    """
+    
+    __slots__ = ("role", "content", "_tokens")
+    
+    def __init__(self, role: str, content: str):
+        """
+        메시지 생성
+        
+        Args:
+            role: 메시지 역할 (user, assistant)
+            content: 메시지 내용
+        """
+        self.role = role
+        self.content = content
+        self._tokens: Optional[int] = None
+    
+    @property
+    def tokens(self) -> int:
+        """메시지 내용의 토큰 수"""
+        if self._tokens is None:
+            self._tokens = count_tokens(self.content)
+        return self._tokens
+    
+    def to_openai(self) -> Dict[str, str]:
+        """
+        OpenAI 메시지 형식으로 변환
+        
+        Returns:
+            role, content 딕셔너리
+        """
+        return {"role": self.role, "content": self.content}
+    
+    def __repr__(self) -> str:
+        return f"ChatMessage(role={self.role!r}, content={self.content!r})"
@@ -3,8 +3,9 @@
 Pydantic 스키마 정의
 주문 및 메뉴 관련 데이터 모델을 정의합니다.
 """
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass, field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from typing import List, Optional, Dict, Any, Tuple, FrozenSet
 from datetime import datetime
 from enum import Enum
 
@@ -17,40 +18,68 @@ class MenuCategory(str, Enum):
     DESSERT = "dessert"
 
 
-class MenuItem(BaseModel):
-    """메뉴 아이템 스키마"""
-    id: str = Field(..., description="메뉴 고유 ID")
-    name: str = Field(..., description="메뉴 이름")
-    category: MenuCategory = Field(..., description="메뉴 카테고리")
-    price: int = Field(..., ge=0, description="가격 (원)")
-    description: str = Field(..., description="메뉴 설명")
-    available: bool = Field(default=True, description="재고 여부")
-    options: List[str] = Field(default_factory=list, description="선택 가능한 옵션")
-    
-    @validator('price')
-    def validate_price(cls, v):
-        """가격 유효성 검증"""
-        if v < 0:
+@dataclass(frozen=True, slots=True)
+class MenuItem:
+    """
+    메뉴 아이템 스키마
+    
+    메뉴 데이터는 시작 시 한 번 만들어지는 정적 데이터이므로
+    Pydantic 모델 대신 불변 슬롯 데이터클래스로 정의합니다.
+    """
+    id: str                     # 메뉴 고유 ID
+    name: str                   # 메뉴 이름
+    category: MenuCategory      # 메뉴 카테고리
+    price: int                  # 가격 (원)
+    description: str            # 메뉴 설명
+    available: bool = True      # 재고 여부
+    options: Tuple[str, ...] = ()  # 선택 가능한 옵션 (메뉴 간 공유되는 불변 튜플)
+    options_set: FrozenSet[str] = field(init=False, repr=False, compare=False)  # 옵션 확인용 집합
+    
+    def __post_init__(self):
+        """가격 유효성 검증 및 옵션 집합 생성"""
+        if self.price < 0:
             raise ValueError("가격은 0 이상이어야 합니다")
-        return v
+        object.__setattr__(self, "options_set", frozenset(self.options))
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        딕셔너리로 변환 (도구 응답용, 파생 필드 제외)
+        
+        Returns:
+            메뉴 딕셔너리
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "category": self.category,
+            "price": self.price,
+            "description": self.description,
+            "available": self.available,
+            "options": self.options
+        }
 
 
 class OrderItem(BaseModel):
     """주문 아이템 스키마"""
+    model_config = ConfigDict(extra="forbid")
+    
     menu_id: str = Field(..., description="메뉴 ID")
     menu_name: str = Field(..., description="메뉴 이름")
-    quantity: int = Field(..., ge=1, description="수량")
+    quantity: int = Field(..., ge=1, le=99, description="수량")
     price: int = Field(..., ge=0, description="단가")
     options: List[str] = Field(default_factory=list, description="선택된 옵션")
     
-    @validator('quantity')
-    def validate_quantity(cls, v):
-        """수량 유효성 검증"""
-        if v < 1:
-            raise ValueError("수량은 1 이상이어야 합니다")
-        if v > 99:
-            raise ValueError("수량은 99 이하여야 합니다")
-        return v
+    # 이름 검색용 소문자 메뉴 이름 (생성 시 한 번만 계산)
+    _menu_name_lower: str = PrivateAttr(default="")
+    
+    def model_post_init(self, __context: Any):
+        """소문자 메뉴 이름 초기화"""
+        self._menu_name_lower = self.menu_name.lower()
+    
+    @property
+    def menu_name_lower(self) -> str:
+        """소문자 메뉴 이름"""
+        return self._menu_name_lower
     
     @property
     def total_price(self) -> int:
@@ -58,24 +87,66 @@ class OrderItem(BaseModel):
         return self.price * self.quantity
 
 
-class Order(BaseModel):
-    """주문 스키마"""
-    order_id: str = Field(..., description="주문 고유 ID")
-    items: List[OrderItem] = Field(default_factory=list, description="주문 아이템 목록")
-    created_at: datetime = Field(default_factory=datetime.now, description="주문 생성 시간")
-    customer_id: Optional[str] = Field(None, description="고객 ID")
-    status: str = Field(default="pending", description="주문 상태")
-    special_request: Optional[str] = Field(None, description="특별 요청사항")
+@dataclass(slots=True)
+class Order:
+    """
+    주문 스키마
+    
+    프로세스 안에서만 생성/변경되므로 검증 없이 슬롯 데이터클래스로 정의합니다.
+    아이템 단위 검증은 OrderItem이 담당합니다.
+    """
+    order_id: str                                           # 주문 고유 ID
+    items: List[OrderItem] = field(default_factory=list)    # 주문 아이템 목록
+    created_at: datetime = field(default_factory=datetime.now)  # 주문 생성 시간
+    customer_id: Optional[str] = None                       # 고객 ID
+    status: str = "pending"                                 # 주문 상태
+    special_request: Optional[str] = None                   # 특별 요청사항
+    
+    # 아이템 추가/제거 시 갱신하는 합계 (조회마다 다시 합산하지 않음)
+    _total_price: int = field(default=0, init=False, repr=False)
+    _item_count: int = field(default=0, init=False, repr=False)
+    
+    def __post_init__(self):
+        """생성 시 전달된 아이템으로 합계 초기화"""
+        self._total_price = sum(item.total_price for item in self.items)
+        self._item_count = sum(item.quantity for item in self.items)
     
     @property
     def total_price(self) -> int:
-        """주문 총 가격 계산"""
-        return sum(item.total_price for item in self.items)
+        """주문 총 가격"""
+        return self._total_price
     
     @property
     def item_count(self) -> int:
         """총 아이템 개수"""
-        return sum(item.quantity for item in self.items)
+        return self._item_count
+    
+    def adjust_totals(self, price_delta: int, count_delta: int):
+        """
+        합계 갱신 (아이템 수량 변경 시 호출)
+        
+        Args:
+            price_delta: 총 가격 변화량
+            count_delta: 총 아이템 개수 변화량
+        """
+        self._total_price += price_delta
+        self._item_count += count_delta
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        딕셔너리로 변환 (도구 응답용)
+        
+        Returns:
+            주문 딕셔너리
+        """
+        return {
+            "order_id": self.order_id,
+            "items": [item.model_dump() for item in self.items],
+            "created_at": self.created_at,
+            "customer_id": self.customer_id,
+            "status": self.status,
+            "special_request": self.special_request
+        }
 
 
 class AgentAction(BaseModel):
@@ -92,10 +163,13 @@ class AgentResponse(BaseModel):
     success: bool = Field(default=True, description="성공 여부")
     error: Optional[str] = Field(None, description="에러 메시지")
     data: Optional[Dict[str, Any]] = Field(None, description="추가 데이터")
+    streamed: bool = Field(default=False, description="메시지가 이미 스트리밍으로 출력되었는지 여부")
 
 
 class ValidationResult(BaseModel):
-    """검증 결과 스키마"""
+    """검증 결과 스키마 (불변, 문제가 없는 결과는 공유)"""
+    model_config = ConfigDict(frozen=True)
+    
     is_valid: bool = Field(..., description="유효성 여부")
-    errors: List[str] = Field(default_factory=list, description="에러 목록")
-    warnings: List[str] = Field(default_factory=list, description="경고 목록")
\ No newline at end of file
+    errors: Tuple[str, ...] = Field(default=(), description="에러 목록")
+    warnings: Tuple[str, ...] = Field(default=(), description="경고 목록")
\ No newline at end of file
@@ -3,14 +3,68 @@
 메뉴 관련 도구 모듈
 메뉴 조회 및 검색 기능을 제공합니다.
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Final, Tuple, Callable
 from models.menu import menu_db
 from models.schemas import MenuItem, MenuCategory
+from utils.formatting import format_won
+
+
+# 카테고리 값 -> 카테고리 (예외 처리 없이 조회)
+_CATEGORY_MAP = {category.value: category for category in MenuCategory}
+
+# 재고 안내 메시지 (주문 가능, 품절)
+_AVAIL_MSG: Final = ("{name}는 주문 가능입니다.", "{name}는 품절입니다.")
+
+# 옵션 안내 메시지
+_OPTIONS_MSG: Final = "{name}의 옵션: {options}"
+
+# 카테고리 한글 이름
+_CATEGORY_NAMES_KO: Final = {
+    MenuCategory.BURGER: "버거",
+    MenuCategory.SIDE: "사이드",
+    MenuCategory.DRINK: "음료",
+    MenuCategory.DESSERT: "디저트"
+}
 
 
 class MenuTools:
     """메뉴 관련 도구 클래스"""
     
+    # 정적 조회 결과 캐시 ((도구 이름, 인자) -> 응답, 메뉴 데이터 버전이 바뀌면 비움)
+    _response_cache: Dict[Tuple[str, Any], Dict[str, Any]] = {}
+    _cache_version: int = -1
+    
+    @classmethod
+    def _cached(cls, key: Tuple[str, Any],
+                build: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        조회 결과 메모이제이션
+        
+        반환되는 딕셔너리는 호출 간에 공유되므로 읽기 전용으로 사용해야 합니다.
+        
+        Args:
+            key: 캐시 키
+            build: 캐시 미스 시 응답 생성 함수
+            
+        Returns:
+            응답 딕셔너리
+        """
+        if cls._cache_version != menu_db.version:
+            cls._response_cache.clear()
+            cls._cache_version = menu_db.version
+        
+        response = cls._response_cache.get(key)
+        if response is None:
+            response = cls._response_cache[key] = build()
+        return response
+    
+    @classmethod
+    def prewarm_cache(cls):
+        """자주 쓰는 조회 결과를 미리 생성"""
+        cls.get_all_menus()
+        for category in MenuCategory:
+            cls.get_menus_by_category(category.value)
+    
     @staticmethod
     def get_menu_info(menu_name: str) -> Dict[str, Any]:
         """
@@ -26,7 +80,7 @@ class MenuTools:
         if menu:
             return {
                 "success": True,
-                "menu": menu.dict(),
+                "menu": menu_db.get_menu_dict(menu.id),
                 "message": f"{menu.name}를 찾았습니다."
             }
         return {
@@ -35,10 +89,20 @@ class MenuTools:
             "message": f"{menu_name}를 찾을 수 없습니다."
         }
     
+    @classmethod
+    def get_all_menus(cls) -> Dict[str, Any]:
+        """
+        전체 메뉴 조회 (결과 캐시)
+        
+        Returns:
+            전체 메뉴 리스트
+        """
+        return cls._cached(("get_all_menus", None), cls._build_all_menus)
+    
     @staticmethod
-    def get_all_menus() -> Dict[str, Any]:
+    def _build_all_menus() -> Dict[str, Any]:
         """
-        전체 메뉴 조회
+        전체 메뉴 응답 생성
         
         Returns:
             전체 메뉴 리스트
@@ -46,13 +110,13 @@ class MenuTools:
         menus = menu_db.get_available_menus()
         return {
             "success": True,
-            "menus": [menu.dict() for menu in menus],
+            "menus": menu_db.get_menu_dicts(menus),
             "count": len(menus),
             "message": f"총 {len(menus)}개의 메뉴가 있습니다."
         }
     
-    @staticmethod
-    def get_menus_by_category(category: str) -> Dict[str, Any]:
+    @classmethod
+    def get_menus_by_category(cls, category: str) -> Dict[str, Any]:
         """
         카테고리별 메뉴 조회
         
@@ -62,30 +126,38 @@ class MenuTools:
         Returns:
             카테고리별 메뉴 리스트
         """
-        try:
-            menu_category = MenuCategory(category.lower())
-            menus = menu_db.get_menus_by_category(menu_category)
-            
-            category_names = {
-                MenuCategory.BURGER: "버거",
-                MenuCategory.SIDE: "사이드",
-                MenuCategory.DRINK: "음료",
-                MenuCategory.DESSERT: "디저트"
-            }
-            
-            return {
-                "success": True,
-                "menus": [menu.dict() for menu in menus],
-                "count": len(menus),
-                "message": f"{category_names.get(menu_category)} 카테고리에 {len(menus)}개의 메뉴가 있습니다."
-            }
-        except ValueError:
+        menu_category = _CATEGORY_MAP.get(category.lower())
+        if menu_category is None:
             return {
                 "success": False,
                 "menus": [],
                 "count": 0,
                 "message": f"'{category}'는 유효하지 않은 카테고리입니다."
             }
+        
+        return cls._cached(
+            ("get_menus_by_category", menu_category),
+            lambda: cls._build_category_menus(menu_category)
+        )
+    
+    @staticmethod
+    def _build_category_menus(menu_category: MenuCategory) -> Dict[str, Any]:
+        """
+        카테고리별 메뉴 응답 생성
+        
+        Args:
+            menu_category: 메뉴 카테고리
+            
+        Returns:
+            카테고리별 메뉴 리스트
+        """
+        menus = menu_db.get_menus_by_category(menu_category)
+        return {
+            "success": True,
+            "menus": menu_db.get_menu_dicts(menus),
+            "count": len(menus),
+            "message": f"{_CATEGORY_NAMES_KO.get(menu_category)} 카테고리에 {len(menus)}개의 메뉴가 있습니다."
+        }
     
     @staticmethod
     def search_menus(keyword: str) -> Dict[str, Any]:
@@ -101,7 +173,7 @@ class MenuTools:
         menus = menu_db.search_menus(keyword)
         return {
             "success": True,
-            "menus": [menu.dict() for menu in menus],
+            "menus": menu_db.get_menu_dicts(menus),
             "count": len(menus),
             "message": f"'{keyword}'로 {len(menus)}개의 메뉴를 찾았습니다."
         }
@@ -122,7 +194,7 @@ class MenuTools:
             return {
                 "success": True,
                 "available": menu.available,
-                "message": f"{menu.name}는 {'주문 가능' if menu.available else '품절'}입니다."
+                "message": _AVAIL_MSG[0 if menu.available else 1].format_map({"name": menu.name})
             }
         return {
             "success": False,
@@ -146,7 +218,10 @@ class MenuTools:
             return {
                 "success": True,
                 "options": menu.options,
-                "message": f"{menu.name}의 옵션: {', '.join(menu.options) if menu.options else '없음'}"
+                "message": _OPTIONS_MSG.format_map({
+                    "name": menu.name,
+                    "options": ", ".join(menu.options) or "없음"
+                })
             }
         return {
             "success": False,
@@ -155,7 +230,7 @@ class MenuTools:
         }
     
     @staticmethod
-    def format_menu_list(menus: List[MenuItem]) -> str:
+    def format_menu_list(menus: Sequence[MenuItem]) -> str:
         """
         메뉴 리스트를 보기 좋게 포맷팅
         
@@ -169,11 +244,12 @@ class MenuTools:
             return "메뉴가 없습니다."
         
         result = []
+        append = result.append
         for menu in menus:
-            result.append(f"- {menu.name}: {menu.price:,}원")
-            result.append(f"  {menu.description}")
+            append(f"- {menu.name}: {format_won(menu.price)}")
+            append(f"  {menu.description}")
             if menu.options:
-                result.append(f"  옵션: {', '.join(menu.options)}")
+                append(f"  옵션: {', '.join(menu.options)}")
         
         return "\n".join(result)
 
@@ -243,4 +319,7 @@ MENU_TOOL_DEFINITIONS = [
             }
         }
     }
-]
\ No newline at end of file
+]
+
+# 메뉴 도구 이름 집합 (주문 상태를 바꾸지 않는 조회 도구 분류용)
+MENU_TOOL_NAMES = frozenset(tool["function"]["name"] for tool in MENU_TOOL_DEFINITIONS)
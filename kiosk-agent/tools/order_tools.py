@@ -3,19 +3,28 @@
 주문 관련 도구 모듈
 주문 생성, 수정, 확인 기능을 제공합니다.
 """
-from typing import Dict, Any, List, Optional
-from datetime import datetime
-import uuid
+from typing import Dict, Any, List, Optional, FrozenSet, Tuple
+from datetime import date
+import os
 from models.schemas import Order, OrderItem
 from models.menu import menu_db
+from utils.formatting import format_won
 
 
 class OrderTools:
     """주문 관련 도구 클래스"""
     
+    __slots__ = ("current_order", "_item_index")
+    
+    # 주문번호 날짜 접두사 캐시 (날짜, YYYYMMDD)
+    _date_prefix_cache: Tuple[Optional[date], str] = (None, "")
+    
     def __init__(self):
         """주문 저장소 초기화"""
         self.current_order: Optional[Order] = None
+        
+        # (메뉴 ID, 옵션 집합) -> 주문 아이템 색인
+        self._item_index: Dict[Tuple[str, FrozenSet[str]], OrderItem] = {}
     
     def create_order(self, customer_id: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -27,11 +36,17 @@ class OrderTools:
         Returns:
             생성된 주문 정보
         """
-        order_id = f"ORD-{datetime.now().strftime('%Y%m%d')}-{uuid.uuid4().hex[:8].upper()}"
+        # 날짜가 바뀔 때만 접두사를 다시 포맷
+        today = date.today()
+        if today != OrderTools._date_prefix_cache[0]:
+            OrderTools._date_prefix_cache = (today, today.strftime("%Y%m%d"))
+        
+        order_id = f"ORD-{OrderTools._date_prefix_cache[1]}-{os.urandom(4).hex().upper()}"
         self.current_order = Order(
             order_id=order_id,
             customer_id=customer_id
         )
+        self._item_index = {}
         
         return {
             "success": True,
@@ -86,11 +101,19 @@ class OrderTools:
                 message = f"{menu.name} 수량이 {existing_item.quantity}개로 업데이트되었습니다."
             else:
                 self.current_order.items.append(order_item)
+                self._item_index[(menu.id, frozenset(order_item.options))] = order_item
                 message = f"{menu.name} {quantity}개가 추가되었습니다."
+            self.current_order.adjust_totals(menu.price * quantity, quantity)
             
             return {
                 "success": True,
-                "item": order_item.dict(),
+                "item": {
+                    "menu_id": menu.id,
+                    "menu_name": menu.name,
+                    "quantity": quantity,
+                    "price": menu.price,
+                    "options": order_item.options
+                },
                 "total_items": self.current_order.item_count,
                 "total_price": self.current_order.total_price,
                 "message": message
@@ -118,16 +141,24 @@ class OrderTools:
                 "message": "주문이 비어있습니다."
             }
         
-        # 아이템 찾기
+        # 아이템 찾기 (검색어 소문자 변환은 한 번만)
+        needle = menu_name.lower()
         for i, item in enumerate(self.current_order.items):
-            if menu_name.lower() in item.menu_name.lower():
+            if needle in item.menu_name_lower:
                 if quantity is None or quantity >= item.quantity:
                     # 전체 제거
                     removed_item = self.current_order.items.pop(i)
+                    self._item_index.pop(
+                        (removed_item.menu_id, frozenset(removed_item.options)), None
+                    )
+                    self.current_order.adjust_totals(
+                        -removed_item.total_price, -removed_item.quantity
+                    )
                     message = f"{removed_item.menu_name}이(가) 주문에서 제거되었습니다."
                 else:
                     # 일부 제거
                     item.quantity -= quantity
+                    self.current_order.adjust_totals(-item.price * quantity, -quantity)
                     message = f"{item.menu_name} {quantity}개가 제거되었습니다. (남은 수량: {item.quantity})"
                 
                 return {
@@ -158,7 +189,7 @@ class OrderTools:
         
         return {
             "success": True,
-            "order": self.current_order.dict(),
+            "order": self.current_order.to_dict(),
             "total_price": self.current_order.total_price,
             "item_count": self.current_order.item_count,
             "message": "현재 주문 내역입니다."
@@ -172,6 +203,7 @@ class OrderTools:
             초기화 결과
         """
         self.current_order = None
+        self._item_index = {}
         return {
             "success": True,
             "message": "주문이 초기화되었습니다."
@@ -191,11 +223,11 @@ class OrderTools:
             }
         
         self.current_order.status = "confirmed"
-        order_summary = self._format_order_summary()
+        order_summary = self.format_order_summary()
         
         return {
             "success": True,
-            "order": self.current_order.dict(),
+            "order": self.current_order.to_dict(),
             "summary": order_summary,
             "message": "주문이 확정되었습니다."
         }
@@ -233,12 +265,9 @@ class OrderTools:
         if not self.current_order:
             return None
         
-        for item in self.current_order.items:
-            if item.menu_id == menu_id and set(item.options) == set(options):
-                return item
-        return None
+        return self._item_index.get((menu_id, frozenset(options)))
     
-    def _format_order_summary(self) -> str:
+    def format_order_summary(self) -> str:
         """
         주문 요약 포맷팅
         
@@ -248,20 +277,22 @@ class OrderTools:
         if not self.current_order:
             return "주문 없음"
         
-        lines = [f"주문번호: {self.current_order.order_id}", ""]
+        order = self.current_order
+        lines = [f"주문번호: {order.order_id}", ""]
+        append = lines.append
         
-        for item in self.current_order.items:
-            lines.append(f"- {item.menu_name} x {item.quantity}")
+        for item in order.items:
+            append(f"- {item.menu_name} x {item.quantity}")
             if item.options:
-                lines.append(f"  옵션: {', '.join(item.options)}")
-            lines.append(f"  {item.total_price:,}원")
+                append(f"  옵션: {', '.join(item.options)}")
+            append(f"  {format_won(item.total_price)}")
         
-        lines.append("")
-        lines.append(f"총 수량: {self.current_order.item_count}개")
-        lines.append(f"총 금액: {self.current_order.total_price:,}원")
+        append("")
+        append(f"총 수량: {order.item_count}개")
+        append(f"총 금액: {format_won(order.total_price)}")
         
-        if self.current_order.special_request:
-            lines.append(f"요청사항: {self.current_order.special_request}")
+        if order.special_request:
+            append(f"요청사항: {order.special_request}")
         
         return "\n".join(lines)
 
@@ -355,4 +386,4 @@ ORDER_TOOL_DEFINITIONS = [
             }
         }
     }
-]
\ No newline at end of file
+]
@@ -0,0 +1,9 @@
+# -*- coding: utf-8 -*-
+"""
+출력 포맷 유틸리티 모듈
+메뉴/주문 요약에서 공통으로 쓰는 포맷 함수
+"""
+
+
+# 금액 포맷 (예: 5,900원, 포맷 메서드를 미리 바인딩)
+format_won = "{:,}원".format
@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""
+요청 속도 제한 유틸리티 모듈
+여러 에이전트가 공유하는 OpenAI 요청 스케줄러 (동시 실행 수 + RPM/TPM 제한)
+"""
+import asyncio
+import json
+import time
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from config.settings import get_settings
+
+
+# 속도 제한 응답 후 요청 속도를 낮춰 유지하는 시간 (초)
+BACKOFF_WINDOW_SECONDS = 30.0
+
+# 요청 속도 배율 하한
+MIN_RATE_SCALE = 0.125
+
+# 회복 구간마다 늘리는 요청 속도 배율
+RATE_SCALE_STEP = 0.25
+
+
+# 도구 정의별 추정 토큰 수 (id -> (도구 정의, 토큰 수), 정의는 모듈 상수라 한 번만 계산)
+_tool_token_cache: Dict[int, Tuple[List[Dict[str, Any]], int]] = {}
+
+
+def _estimate_tool_tokens(tools: List[Dict[str, Any]]) -> int:
+    """
+    도구 정의 토큰 수 대략 추정
+    
+    Args:
+        tools: 요청에 함께 보내는 도구 정의 리스트
+    
+    Returns:
+        추정 토큰 수
+    """
+    cached = _tool_token_cache.get(id(tools))
+    if cached is not None and cached[0] is tools:
+        return cached[1]
+    
+    chars = len(json.dumps(tools, ensure_ascii=False, separators=(",", ":")))
+    tokens = chars // 2
+    _tool_token_cache[id(tools)] = (tools, tokens)
+    return tokens
+
+
+def estimate_tokens(messages: List[Dict[str, Any]],
+                    tools: Optional[List[Dict[str, Any]]] = None) -> int:
+    """
+    요청 토큰 수 대략 추정 (TPM 예약용)
+    
+    한글은 글자당 토큰 수가 높아 글자 수의 절반에 메시지당 오버헤드를 더해
+    넉넉하게 추정합니다. 도구 정의도 매 요청에 포함되므로 함께 더합니다.
+    실제 사용량은 응답의 usage로 보정합니다.
+    
+    Args:
+        messages: 요청 메시지 리스트
+        tools: 요청에 함께 보내는 도구 정의 리스트 (선택)
+    
+    Returns:
+        추정 토큰 수
+    """
+    chars = sum(len(message.get("content") or "") for message in messages)
+    tokens = chars // 2 + 4 * len(messages)
+    if tools:
+        tokens += _estimate_tool_tokens(tools)
+    return tokens
+
+
+class _TokenBucket:
+    """분당 한도를 초 단위로 채우는 토큰 버킷"""
+    
+    __slots__ = ("capacity", "rate", "tokens", "updated")
+    
+    def __init__(self, per_minute: int):
+        """
+        토큰 버킷 초기화
+        
+        Args:
+            per_minute: 분당 허용량
+        """
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+    
+    def refill(self, now: float, scale: float):
+        """
+        경과 시간만큼 토큰 충전
+        
+        Args:
+            now: 현재 시각 (monotonic)
+            scale: 충전 속도 배율
+        """
+        elapsed = now - self.updated
+        self.updated = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate * scale)
+    
+    def wait_time(self, amount: float, scale: float) -> float:
+        """
+        요청량을 확보하기까지 남은 시간 계산
+        
+        Args:
+            amount: 필요한 양
+            scale: 충전 속도 배율
+        
+        Returns:
+            대기 시간 (초, 바로 가능하면 0)
+        """
+        # 버킷 용량보다 큰 요청은 가득 찼을 때 허용
+        shortage = min(amount, self.capacity) - self.tokens
+        if shortage <= 0:
+            return 0.0
+        return shortage / (self.rate * scale)
+
+
+class RateLimiter:
+    """
+    LLM 요청 스케줄러
+    
+    세마포어로 동시 요청 수를 제한하고, RPM/TPM 토큰 버킷으로 계정 한도 안에서
+    요청을 내보냅니다. 속도 제한(429) 응답을 받으면 충전 속도를 절반으로 줄이고,
+    이후 문제가 없으면 구간마다 조금씩 회복합니다 (AIMD).
+    """
+    
+    def __init__(self, max_concurrency: int, requests_per_minute: int,
+                 tokens_per_minute: int):
+        """
+        스케줄러 초기화
+        
+        Args:
+            max_concurrency: 최대 동시 요청 수
+            requests_per_minute: 분당 최대 요청 수
+            tokens_per_minute: 분당 최대 토큰 수
+        """
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._lock = asyncio.Lock()
+        self._requests = _TokenBucket(requests_per_minute)
+        self._tokens = _TokenBucket(tokens_per_minute)
+        self._scale = 1.0
+        self._backoff_until = 0.0
+    
+    def reserve(self, estimated_tokens: int) -> "Reservation":
+        """
+        요청 슬롯 예약
+        
+        Args:
+            estimated_tokens: 예상 토큰 수
+        
+        Returns:
+            `async with`로 사용하는 예약 객체
+        """
+        return Reservation(self, estimated_tokens)
+    
+    async def _acquire(self, estimated_tokens: int):
+        """
+        요청 슬롯 확보 (한도를 넘으면 대기)
+        
+        Args:
+            estimated_tokens: 예상 토큰 수
+        """
+        await self._semaphore.acquire()
+        try:
+            # 대기 순서를 지키도록 한 번에 하나씩 버킷 확인
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    self._recover(now)
+                    self._requests.refill(now, self._scale)
+                    self._tokens.refill(now, self._scale)
+                    
+                    wait = max(
+                        self._requests.wait_time(1, self._scale),
+                        self._tokens.wait_time(estimated_tokens, self._scale)
+                    )
+                    if wait <= 0:
+                        break
+                    await asyncio.sleep(wait)
+                
+                self._requests.tokens -= 1
+                self._tokens.tokens -= estimated_tokens
+        except BaseException:
+            self._semaphore.release()
+            raise
+    
+    def _release(self, estimated_tokens: int, used_tokens: Optional[int],
+                 error: Optional[BaseException]):
+        """
+        요청 슬롯 반환
+        
+        Args:
+            estimated_tokens: 예약한 토큰 수
+            used_tokens: 실제 사용 토큰 수 (알 수 없으면 None)
+            error: 요청 중 발생한 예외
+        """
+        self._semaphore.release()
+        
+        # 예약량과 실제 사용량의 차이 보정
+        if used_tokens is not None:
+            self._tokens.tokens -= used_tokens - estimated_tokens
+        
+        if error is not None and getattr(error, "status_code", None) == 429:
+            self._back_off()
+    
+    def _back_off(self):
+        """속도 제한 응답 시 충전 속도를 절반으로 감소"""
+        self._scale = max(MIN_RATE_SCALE, self._scale / 2)
+        self._backoff_until = time.monotonic() + BACKOFF_WINDOW_SECONDS
+    
+    def _recover(self, now: float):
+        """
+        감속 구간이 지나면 충전 속도를 단계적으로 회복
+        
+        Args:
+            now: 현재 시각 (monotonic)
+        """
+        if self._scale < 1.0 and now >= self._backoff_until:
+            self._scale = min(1.0, self._scale + RATE_SCALE_STEP)
+            self._backoff_until = now + BACKOFF_WINDOW_SECONDS
+
+
+class Reservation:
+    """요청 슬롯 예약 (`async with` 블록 동안 슬롯 점유)"""
+    
+    __slots__ = ("_limiter", "estimated_tokens", "used_tokens")
+    
+    def __init__(self, limiter: RateLimiter, estimated_tokens: int):
+        """
+        예약 생성
+        
+        Args:
+            limiter: 요청 스케줄러
+            estimated_tokens: 예상 토큰 수
+        """
+        self._limiter = limiter
+        self.estimated_tokens = estimated_tokens
+        self.used_tokens: Optional[int] = None
+    
+    async def __aenter__(self) -> "Reservation":
+        await self._limiter._acquire(self.estimated_tokens)
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        self._limiter._release(self.estimated_tokens, self.used_tokens, exc)
+        return False
+
+
+@lru_cache(maxsize=None)
+def get_rate_limiter() -> RateLimiter:
+    """
+    공유 요청 스케줄러 조회 (최초 호출 시 생성)
+    
+    Returns:
+        요청 스케줄러
+    """
+    settings = get_settings()
+    return RateLimiter(
+        max_concurrency=settings.llm_max_concurrency,
+        requests_per_minute=settings.llm_requests_per_minute,
+        tokens_per_minute=settings.llm_tokens_per_minute
+    )
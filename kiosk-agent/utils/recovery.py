@@ -4,34 +4,247 @@
 에러 처리 및 재시도 로직
 """
 import asyncio
-from typing import Callable, Any, Optional, TypeVar, Dict
+import logging
+import random
+import re
+import time
+from collections import deque
+from types import MappingProxyType
+from typing import Callable, Any, Optional, TypeVar, Dict, Tuple, Type, Mapping
 from functools import wraps
 import traceback
+import warnings
 from datetime import datetime
+from cache.lru_cache import LRUCache
 
 
 T = TypeVar('T')
 
+logger = logging.getLogger(__name__)
+
+# 에러 로그 최대 보관 개수 기본값
+DEFAULT_MAX_LOG_ENTRIES = 100
+
+# 에러 로그 최대 보관 크기 기본값 (메시지와 트레이스백 글자 수 기준)
+DEFAULT_MAX_LOG_BYTES = 1_048_576
+
+# 결과 캐시 최대 항목 수 기본값
+DEFAULT_RESULT_CACHE_SIZE = 1024
+
+# 캐시 미스 표시용 센티널
+_MISS = object()
+
+# 재시도하면 해결될 수 있는 예외
+RECOVERABLE_ERRORS: Tuple[Type[BaseException], ...] = (
+    TimeoutError, ConnectionError, asyncio.TimeoutError
+)
+
+# 재시도해도 같은 결과가 나오는 예외 (즉시 실패)
+UNRECOVERABLE_ERRORS: Tuple[Type[BaseException], ...] = (
+    PermissionError, ValueError, TypeError
+)
+
+
+def is_recoverable_error(
+    error: BaseException,
+    recoverable: Tuple[Type[BaseException], ...] = RECOVERABLE_ERRORS,
+    unrecoverable: Tuple[Type[BaseException], ...] = UNRECOVERABLE_ERRORS
+) -> bool:
+    """
+    예외의 재시도 가능 여부 판단
+    
+    Args:
+        error: 에러 객체
+        recoverable: 재시도 가능한 예외 타입
+        unrecoverable: 재시도 불가능한 예외 타입
+        
+    Returns:
+        재시도 가능 여부
+    """
+    if isinstance(error, unrecoverable):
+        return False
+    if isinstance(error, recoverable):
+        return True
+    
+    # HTTP 상태 코드가 있는 API 에러는 429/5xx만 재시도
+    status_code = getattr(error, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code == 429 or status_code >= 500
+    
+    return ErrorHandler.handle_api_error(error)["recoverable"]
+
+
+def _backoff_delay(base_delay: float, attempt: int,
+                   max_delay: float, jitter: float) -> float:
+    """
+    지터를 적용한 지수 백오프 지연 시간 계산
+    
+    여러 클라이언트가 동시에 재시도하지 않도록 지연 시간에 무작위 값을 더합니다.
+    
+    Args:
+        base_delay: 기본 지연 시간 (초)
+        attempt: 시도 번호 (0부터 시작)
+        max_delay: 최대 지연 시간 (초)
+        jitter: 지터 비율 (0.5면 최대 50% 추가)
+        
+    Returns:
+        지연 시간 (초)
+    """
+    return min(max_delay, base_delay * (2 ** attempt) * (1 + random.random() * jitter))
+
+
+def _warn_if_loop_running():
+    """이벤트 루프 안에서 동기 대기하면 루프 전체가 멈추므로 경고"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    warnings.warn(
+        "실행 중인 이벤트 루프 안에서 time.sleep으로 대기하면 루프가 멈춥니다. "
+        "retry_async를 사용하세요",
+        RuntimeWarning,
+        stacklevel=3
+    )
+
 
 class RecoveryManager:
     """에러 복구 관리 클래스"""
     
-    def __init__(self, max_retries: int = 3, base_delay: float = 1.0):
+    RECOVERABLE = RECOVERABLE_ERRORS
+    UNRECOVERABLE = UNRECOVERABLE_ERRORS
+    
+    def __init__(self, max_retries: int = 3, base_delay: float = 1.0,
+                 max_delay: float = 30.0, jitter: float = 0.5,
+                 total_budget: Optional[float] = None,
+                 recoverable: Optional[Tuple[Type[BaseException], ...]] = None,
+                 unrecoverable: Optional[Tuple[Type[BaseException], ...]] = None,
+                 max_log_entries: int = DEFAULT_MAX_LOG_ENTRIES,
+                 max_log_bytes: int = DEFAULT_MAX_LOG_BYTES,
+                 result_cache_size: int = DEFAULT_RESULT_CACHE_SIZE,
+                 capture_traceback: bool = False):
         """
         복구 관리자 초기화
         
         Args:
             max_retries: 최대 재시도 횟수
             base_delay: 기본 지연 시간 (초)
+            max_delay: 최대 지연 시간 (초)
+            jitter: 지연 시간 지터 비율
+            total_budget: 전체 재시도 시간 예산 (초, None이면 제한 없음)
+            recoverable: 재시도 가능한 예외 타입 (없으면 기본값 사용)
+            unrecoverable: 재시도 불가능한 예외 타입 (없으면 기본값 사용)
+            max_log_entries: 에러 로그 최대 보관 개수 (초과 시 오래된 항목부터 삭제)
+            max_log_bytes: 에러 로그 최대 보관 크기 (초과 시 오래된 항목부터 삭제)
+            result_cache_size: 멱등 호출 결과 캐시 최대 항목 수
+            capture_traceback: 에러 로그에 트레이스백 포함 여부
+            
+        Raises:
+            ValueError: max_log_entries가 1 미만인 경우
         """
+        if max_log_entries < 1:
+            raise ValueError("max_log_entries는 1 이상이어야 합니다")
+        
         self.max_retries = max_retries
         self.base_delay = base_delay
-        self.error_log: list = []
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.total_budget = total_budget
+        if recoverable is not None:
+            self.RECOVERABLE = recoverable
+        if unrecoverable is not None:
+            self.UNRECOVERABLE = unrecoverable
+        self.capture_traceback = capture_traceback
+        self.error_log: deque = deque(maxlen=max_log_entries)
+        self._log_bytes = 0
+        self._log_byte_cap = max_log_bytes
+        self._result_cache = LRUCache(maxsize=result_cache_size)
+    
+    def is_recoverable(self, error: BaseException) -> bool:
+        """
+        재시도 여부 판단 (제공자별 분류가 필요하면 재정의)
+        
+        Args:
+            error: 에러 객체
+            
+        Returns:
+            재시도 가능 여부
+        """
+        return is_recoverable_error(error, self.RECOVERABLE, self.UNRECOVERABLE)
+    
+    def _next_delay(self, attempt: int, deadline: Optional[float]) -> Optional[float]:
+        """
+        다음 재시도까지의 지연 시간 계산
+        
+        Args:
+            attempt: 시도 번호 (0부터 시작)
+            deadline: 재시도 마감 시각 (monotonic, None이면 제한 없음)
+            
+        Returns:
+            지연 시간 (마지막 시도이거나 예산을 넘으면 None)
+        """
+        if attempt >= self.max_retries - 1:
+            return None
+        
+        delay = _backoff_delay(self.base_delay, attempt, self.max_delay, self.jitter)
+        if deadline is not None and time.monotonic() + delay > deadline:
+            return None
+        return delay
+    
+    def _deadline(self) -> Optional[float]:
+        """
+        재시도 마감 시각 계산
+        
+        Returns:
+            마감 시각 (monotonic, 예산이 없으면 None)
+        """
+        if self.total_budget is None:
+            return None
+        return time.monotonic() + self.total_budget
+    
+    @staticmethod
+    def _cache_key(func: Callable, args: tuple, kwargs: Dict[str, Any]) -> Optional[tuple]:
+        """
+        결과 캐시 키 생성
+        
+        함수 객체를 키에 포함하므로 같은 메서드라도 인스턴스별로 구분됩니다.
+        
+        Args:
+            func: 호출할 함수
+            args: 함수 인자
+            kwargs: 함수 키워드 인자
+            
+        Returns:
+            캐시 키 (인자를 해시할 수 없으면 None)
+        """
+        try:
+            key = (func, args, frozenset(kwargs.items()))
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def invalidate(self, func: Callable, *args, **kwargs):
+        """
+        특정 호출의 캐시된 결과 삭제
+        
+        Args:
+            func: 캐시된 함수
+            *args: 함수 인자
+            **kwargs: 함수 키워드 인자
+        """
+        key = self._cache_key(func, args, kwargs)
+        if key is not None:
+            self._result_cache.pop(key)
+    
+    def clear_cache(self):
+        """결과 캐시 초기화"""
+        self._result_cache.clear()
     
     async def retry_async(
         self,
         func: Callable,
         *args,
+        cacheable: bool = False,
         **kwargs
     ) -> tuple[bool, Any]:
         """
@@ -40,25 +253,40 @@ class RecoveryManager:
         Args:
             func: 실행할 비동기 함수
             *args: 함수 인자
+            cacheable: 멱등 호출이면 True (성공 결과를 캐시하고 재사용)
             **kwargs: 함수 키워드 인자
             
         Returns:
             (성공 여부, 결과 또는 에러)
         """
+        cache_key = self._cache_key(func, args, kwargs) if cacheable else None
+        if cache_key is not None:
+            cached = self._result_cache.get(cache_key, _MISS)
+            if cached is not _MISS:
+                return True, cached
+        
         last_error = None
+        deadline = self._deadline()
         
         for attempt in range(self.max_retries):
             try:
                 result = await func(*args, **kwargs)
+                if cache_key is not None:
+                    self._result_cache.put(cache_key, result)
                 return True, result
             except Exception as e:
                 last_error = e
                 self._log_error(func.__name__, e, attempt + 1)
                 
-                if attempt < self.max_retries - 1:
-                    # 지수 백오프
-                    delay = self.base_delay * (2 ** attempt)
-                    await asyncio.sleep(delay)
+                # 재시도해도 소용없는 에러는 즉시 실패
+                if not self.is_recoverable(e):
+                    break
+                
+                # 지수 백오프 (지터 적용, 시간 예산 초과 시 중단)
+                delay = self._next_delay(attempt, deadline)
+                if delay is None:
+                    break
+                await asyncio.sleep(delay)
         
         return False, last_error
     
@@ -66,6 +294,7 @@ class RecoveryManager:
         self,
         func: Callable,
         *args,
+        cacheable: bool = False,
         **kwargs
     ) -> tuple[bool, Any]:
         """
@@ -74,26 +303,47 @@ class RecoveryManager:
         Args:
             func: 실행할 함수
             *args: 함수 인자
+            cacheable: 멱등 호출이면 True (성공 결과를 캐시하고 재사용)
             **kwargs: 함수 키워드 인자
             
         Returns:
             (성공 여부, 결과 또는 에러)
+            
+        Raises:
+            TypeError: 비동기 함수를 전달한 경우
         """
+        if asyncio.iscoroutinefunction(func):
+            raise TypeError(f"{func.__name__}은(는) 비동기 함수입니다. retry_async를 사용하세요")
+        
+        cache_key = self._cache_key(func, args, kwargs) if cacheable else None
+        if cache_key is not None:
+            cached = self._result_cache.get(cache_key, _MISS)
+            if cached is not _MISS:
+                return True, cached
+        
         last_error = None
+        deadline = self._deadline()
         
         for attempt in range(self.max_retries):
             try:
                 result = func(*args, **kwargs)
+                if cache_key is not None:
+                    self._result_cache.put(cache_key, result)
                 return True, result
             except Exception as e:
                 last_error = e
                 self._log_error(func.__name__, e, attempt + 1)
                 
-                if attempt < self.max_retries - 1:
-                    # 지수 백오프
-                    import time
-                    delay = self.base_delay * (2 ** attempt)
-                    time.sleep(delay)
+                # 재시도해도 소용없는 에러는 즉시 실패
+                if not self.is_recoverable(e):
+                    break
+                
+                # 지수 백오프 (지터 적용, 시간 예산 초과 시 중단)
+                delay = self._next_delay(attempt, deadline)
+                if delay is None:
+                    break
+                _warn_if_loop_running()
+                time.sleep(delay)
         
         return False, last_error
     
@@ -106,17 +356,28 @@ class RecoveryManager:
             error: 에러 객체
             attempt: 시도 횟수
         """
+        # 시각과 트레이스백 문자열은 로그를 조회할 때 생성 (트레이스백은 요청된 경우에만)
         error_info = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": None,
+            "timestamp_ns": time.time_ns(),
             "function": func_name,
             "error_type": type(error).__name__,
             "error_message": str(error),
             "attempt": attempt,
-            "traceback": traceback.format_exc()
+            "traceback": None
         }
+        if self.capture_traceback:
+            error_info["_error"] = error
+        
+        # 개수 제한으로 밀려날 항목의 크기를 먼저 반영
+        if self.error_log and len(self.error_log) == self.error_log.maxlen:
+            self._log_bytes -= self._entry_size(self.error_log.popleft())
+        size = self._entry_size(error_info)
+        self._trim_error_log(size)
         self.error_log.append(error_info)
+        self._log_bytes += size
         
-        print(f"[에러 {attempt}/{self.max_retries}] {func_name}: {error}")
+        logger.warning("[에러 %d/%d] %s: %s", attempt, self.max_retries, func_name, error)
     
     def get_error_log(self) -> list:
         """
@@ -125,20 +386,61 @@ class RecoveryManager:
         Returns:
             에러 로그 리스트
         """
-        return self.error_log
+        for error_info in self.error_log:
+            if error_info["timestamp"] is None:
+                error_info["timestamp"] = datetime.fromtimestamp(
+                    error_info["timestamp_ns"] / 1e9
+                ).isoformat()
+            error = error_info.pop("_error", None)
+            if error is not None:
+                error_info["traceback"] = "".join(
+                    traceback.format_exception(type(error), error, error.__traceback__)
+                )
+                self._log_bytes += len(error_info["traceback"])
+        
+        # 트레이스백 생성으로 늘어난 크기 반영
+        self._trim_error_log(0)
+        return list(self.error_log)
+    
+    @staticmethod
+    def _entry_size(error_info: Dict[str, Any]) -> int:
+        """
+        에러 로그 항목의 대략적인 크기 계산
+        
+        Args:
+            error_info: 에러 로그 항목
+            
+        Returns:
+            메시지와 트레이스백 글자 수 합계
+        """
+        return len(error_info["error_message"]) + len(error_info["traceback"] or "")
+    
+    def _trim_error_log(self, incoming: int):
+        """
+        크기 제한을 넘지 않도록 오래된 에러 로그부터 삭제
+        
+        Args:
+            incoming: 새로 추가할 항목의 크기
+        """
+        while self.error_log and self._log_bytes + incoming > self._log_byte_cap:
+            self._log_bytes -= self._entry_size(self.error_log.popleft())
     
     def clear_error_log(self):
         """에러 로그 초기화"""
-        self.error_log = []
+        self.error_log.clear()
+        self._log_bytes = 0
 
 
-def with_recovery(max_retries: int = 3, base_delay: float = 1.0):
+def with_recovery(max_retries: int = 3, base_delay: float = 1.0,
+                  max_delay: float = 30.0, jitter: float = 0.5):
     """
     에러 복구 데코레이터 (비동기 함수용)
     
     Args:
         max_retries: 최대 재시도 횟수
         base_delay: 기본 지연 시간
+        max_delay: 최대 지연 시간
+        jitter: 지연 시간 지터 비율
         
     Returns:
         데코레이터 함수
@@ -155,8 +457,12 @@ def with_recovery(max_retries: int = 3, base_delay: float = 1.0):
                     last_error = e
                     print(f"[재시도 {attempt + 1}/{max_retries}] {func.__name__}: {e}")
                     
+                    # 재시도해도 소용없는 에러는 즉시 전파
+                    if not is_recoverable_error(e):
+                        raise
+                    
                     if attempt < max_retries - 1:
-                        delay = base_delay * (2 ** attempt)
+                        delay = _backoff_delay(base_delay, attempt, max_delay, jitter)
                         await asyncio.sleep(delay)
             
             # 모든 재시도 실패
@@ -177,13 +483,17 @@ def with_fallback(fallback_value: Any = None):
         데코레이터 함수
     """
     def decorator(func: Callable) -> Callable:
-        @wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            try:
-                return await func(*args, **kwargs)
-            except Exception as e:
-                print(f"[대체값 사용] {func.__name__}: {e}")
-                return fallback_value
+        # 비동기 함수 여부에 따라 필요한 래퍼만 생성
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    print(f"[대체값 사용] {func.__name__}: {e}")
+                    return fallback_value
+            
+            return async_wrapper
         
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
@@ -193,19 +503,51 @@ def with_fallback(fallback_value: Any = None):
                 print(f"[대체값 사용] {func.__name__}: {e}")
                 return fallback_value
         
-        # 비동기 함수 여부 확인
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
         return sync_wrapper
     
     return decorator
 
 
+# 키워드별 API 에러 응답 (읽기 전용, 호출마다 새로 만들지 않음)
+_TIMEOUT_RESP: Mapping[str, Any] = MappingProxyType({
+    "success": False,
+    "error_type": "timeout",
+    "message": "요청 시간이 초과되었습니다. 다시 시도해주세요.",
+    "recoverable": True
+})
+_RATE_LIMIT_RESP: Mapping[str, Any] = MappingProxyType({
+    "success": False,
+    "error_type": "rate_limit",
+    "message": "요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+    "recoverable": True
+})
+_AUTH_RESP: Mapping[str, Any] = MappingProxyType({
+    "success": False,
+    "error_type": "authentication",
+    "message": "인증에 실패했습니다. 설정을 확인해주세요.",
+    "recoverable": False
+})
+# API 에러 분류 규칙 (우선순위 순서대로 검사, 먼저 일치한 규칙 사용)
+_API_ERR_RULES: Tuple[Tuple["re.Pattern", Mapping[str, Any]], ...] = (
+    (re.compile(r"timeout", re.I), _TIMEOUT_RESP),
+    (re.compile(r"rate\s*limit", re.I), _RATE_LIMIT_RESP),
+    (re.compile(r"authentication", re.I), _AUTH_RESP),
+)
+
+# 사용자 안내 메시지 분류 규칙 (우선순위 순서대로 검사)
+_FRIENDLY_ERR_RULES: Tuple[Tuple["re.Pattern", str], ...] = (
+    (re.compile(r"connection", re.I), "네트워크 연결에 문제가 있습니다. 인터넷 연결을 확인해주세요."),
+    (re.compile(r"not found", re.I), "요청하신 항목을 찾을 수 없습니다."),
+    (re.compile(r"invalid", re.I), "입력하신 정보가 올바르지 않습니다."),
+    (re.compile(r"permission|forbidden", re.I), "권한이 없습니다."),
+)
+
+
 class ErrorHandler:
     """에러 핸들러 클래스"""
     
     @staticmethod
-    def handle_api_error(error: Exception) -> Dict[str, Any]:
+    def handle_api_error(error: Exception) -> Mapping[str, Any]:
         """
         API 에러 처리
         
@@ -213,40 +555,21 @@ class ErrorHandler:
             error: 에러 객체
             
         Returns:
-            에러 응답 딕셔너리
+            에러 응답 딕셔너리 (알려진 에러는 읽기 전용 공유 객체)
         """
-        error_type = type(error).__name__
         error_message = str(error)
         
         # 에러 타입별 처리
-        if "timeout" in error_message.lower():
-            return {
-                "success": False,
-                "error_type": "timeout",
-                "message": "요청 시간이 초과되었습니다. 다시 시도해주세요.",
-                "recoverable": True
-            }
-        elif "rate limit" in error_message.lower():
-            return {
-                "success": False,
-                "error_type": "rate_limit",
-                "message": "요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
-                "recoverable": True
-            }
-        elif "authentication" in error_message.lower():
-            return {
-                "success": False,
-                "error_type": "authentication",
-                "message": "인증에 실패했습니다. 설정을 확인해주세요.",
-                "recoverable": False
-            }
-        else:
-            return {
-                "success": False,
-                "error_type": error_type,
-                "message": f"오류가 발생했습니다: {error_message}",
-                "recoverable": True
-            }
+        for pattern, response in _API_ERR_RULES:
+            if pattern.search(error_message):
+                return response
+        
+        return {
+            "success": False,
+            "error_type": type(error).__name__,
+            "message": f"오류가 발생했습니다: {error_message}",
+            "recoverable": True
+        }
     
     @staticmethod
     def handle_validation_error(errors: list) -> str:
@@ -265,11 +588,9 @@ class ErrorHandler:
         if len(errors) == 1:
             return f"오류: {errors[0]}"
         
-        error_lines = ["다음 오류들이 발견되었습니다:"]
-        for i, error in enumerate(errors, 1):
-            error_lines.append(f"{i}. {error}")
-        
-        return "\n".join(error_lines)
+        return "다음 오류들이 발견되었습니다:\n" + "\n".join(
+            f"{i}. {error}" for i, error in enumerate(errors, 1)
+        )
     
     @staticmethod
     def create_user_friendly_message(error: Exception) -> str:
@@ -282,19 +603,12 @@ class ErrorHandler:
         Returns:
             친화적인 에러 메시지
         """
-        error_message = str(error).lower()
-        
         # 일반적인 에러 메시지 매핑
-        if "connection" in error_message:
-            return "네트워크 연결에 문제가 있습니다. 인터넷 연결을 확인해주세요."
-        elif "not found" in error_message:
-            return "요청하신 항목을 찾을 수 없습니다."
-        elif "invalid" in error_message:
-            return "입력하신 정보가 올바르지 않습니다."
-        elif "permission" in error_message or "forbidden" in error_message:
-            return "권한이 없습니다."
-        else:
-            return "일시적인 오류가 발생했습니다. 다시 시도해주세요."
+        error_message = str(error)
+        for pattern, message in _FRIENDLY_ERR_RULES:
+            if pattern.search(error_message):
+                return message
+        return "일시적인 오류가 발생했습니다. 다시 시도해주세요."
 
 
 # 전역 복구 관리자 인스턴스
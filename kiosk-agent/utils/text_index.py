@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+텍스트 색인 유틸리티 모듈
+부분 문자열 검색을 위한 n-gram 역색인
+"""
+from typing import Dict, Hashable, Optional, Set
+
+
+class NgramIndex:
+    """
+    n-gram 역색인 클래스
+    
+    한글은 조사가 붙어 단어 단위 색인으로는 부분 일치를 찾을 수 없으므로
+    글자 n-gram으로 색인합니다. 검색 결과는 후보 집합이므로 호출하는 쪽에서
+    실제 부분 문자열 포함 여부를 한 번 더 확인해야 합니다.
+    """
+    
+    def __init__(self, n: int = 2):
+        """
+        색인 초기화
+        
+        Args:
+            n: n-gram 길이
+        """
+        self.n = n
+        self._postings: Dict[str, Set[Hashable]] = {}
+    
+    def _ngrams(self, text: str) -> Set[str]:
+        """
+        텍스트의 n-gram 집합 생성
+        
+        Args:
+            text: 텍스트
+            
+        Returns:
+            n-gram 집합
+        """
+        n = self.n
+        return {text[i:i + n] for i in range(len(text) - n + 1)}
+    
+    def add(self, key: Hashable, text: str):
+        """
+        텍스트 색인
+        
+        Args:
+            key: 문서 키
+            text: 색인할 텍스트 (정규화된 상태)
+        """
+        for gram in self._ngrams(text):
+            self._postings.setdefault(gram, set()).add(key)
+    
+    def remove(self, key: Hashable, text: str):
+        """
+        색인에서 텍스트 제거
+        
+        Args:
+            key: 문서 키
+            text: 색인했던 텍스트
+        """
+        for gram in self._ngrams(text):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[gram]
+    
+    def candidates(self, query: str) -> Optional[Set[Hashable]]:
+        """
+        쿼리를 포함할 수 있는 문서 키 조회
+        
+        Args:
+            query: 검색 쿼리 (정규화된 상태)
+            
+        Returns:
+            후보 키 집합 (쿼리가 n보다 짧으면 None - 전체 검색 필요)
+        """
+        if len(query) < self.n:
+            return None
+        
+        # 가장 짧은 posting list부터 교집합
+        postings = []
+        for gram in self._ngrams(query):
+            posting = self._postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result &= posting
+            if not result:
+                break
+        return result
+    
+    def clear(self):
+        """색인 초기화"""
+        self._postings.clear()
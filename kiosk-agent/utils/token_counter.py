@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+토큰 계산 유틸리티 모듈
+대화 기록을 토큰 예산에 맞춰 자르기 위한 토큰 수 계산
+"""
+from functools import lru_cache
+from typing import Optional
+from config.settings import get_settings
+
+
+# 메시지마다 붙는 역할/구분자 토큰 수 (근사값)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str):
+    """
+    모델 인코딩 조회 (모델별로 한 번만 로드)
+
+    Args:
+        model: 모델 이름
+
+    Returns:
+        tiktoken 인코딩 (불러올 수 없으면 None)
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    # BPE 파일 다운로드 실패 등 어떤 오류든 글자 수 기반 추정으로 대체
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            # 아직 등록되지 않은 모델은 최신 인코딩 사용
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        print(f"토큰 인코딩 로드 실패 (글자 수 기반 추정 사용): {e}")
+        return None
+
+
+def prewarm_encoding(model: Optional[str] = None) -> bool:
+    """
+    모델 인코딩 미리 로드 (BPE 파일 다운로드가 필요할 수 있으므로 시작 시 스레드에서 호출)
+
+    Args:
+        model: 모델 이름 (없으면 설정값 사용)
+
+    Returns:
+        인코딩 로드 성공 여부
+    """
+    return _get_encoding(model or get_settings().openai_model) is not None
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """
+    텍스트 토큰 수 계산
+
+    Args:
+        text: 텍스트
+        model: 모델 이름 (없으면 설정값 사용)
+
+    Returns:
+        토큰 수 (tiktoken이 없으면 글자 수 기반 추정치)
+    """
+    encoding = _get_encoding(model or get_settings().openai_model)
+    if encoding is None:
+        return len(text) // 2 + 1
+    return len(encoding.encode(text))
@@ -3,11 +3,94 @@
 검증 유틸리티 모듈
 입력 데이터 및 주문 검증 기능
 """
-from typing import List, Dict, Any
-from models.schemas import ValidationResult, Order, OrderItem
+import re
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+from models.schemas import ValidationResult, Order, OrderItem, MenuItem
 from models.menu import menu_db
 
 
+# 허용하지 않는 입력 패턴 (보안)
+_DANGEROUS_RE = re.compile(r"<script>|javascript:|onerror=", re.I)
+
+# 숫자 추출 패턴
+_DIGIT_RE = re.compile(r"\d+")
+
+# 메뉴 이름 표현 통일
+_NORM_REPLACEMENTS = {
+    "햄버거": "버거",
+    "감튀": "감자튀김",
+    "콜": "콜라",
+}
+
+
+def _build_norm_pattern(replacements: Dict[str, str]) -> "re.Pattern":
+    """
+    치환표에서 한 번에 스캔하는 정규식 생성
+    
+    긴 표현을 먼저 찾고, 대체 문자열이 원래 표현으로 시작하면 이미 대체된
+    표현("콜라"의 "콜")은 다시 치환하지 않도록 부정 전방 탐색을 붙입니다.
+    
+    Args:
+        replacements: {원래 표현: 대체 표현} 치환표
+        
+    Returns:
+        컴파일된 정규식
+    """
+    alternatives = []
+    for old in sorted(replacements, key=len, reverse=True):
+        new = replacements[old]
+        pattern = re.escape(old)
+        if new.startswith(old) and new != old:
+            pattern += f"(?!{re.escape(new[len(old):])})"
+        alternatives.append(pattern)
+    return re.compile("|".join(alternatives))
+
+
+_NORM_RE = _build_norm_pattern(_NORM_REPLACEMENTS)
+
+# 문제가 없을 때 공유하는 검증 결과 (불변)
+_VALID_RESULT = ValidationResult(is_valid=True)
+
+
+def _append(messages: Optional[List[str]], message: str) -> List[str]:
+    """
+    메시지 추가 (첫 메시지일 때 리스트 생성)
+    
+    Args:
+        messages: 기존 메시지 리스트 (없으면 None)
+        message: 추가할 메시지
+        
+    Returns:
+        메시지 리스트
+    """
+    if messages is None:
+        return [message]
+    messages.append(message)
+    return messages
+
+
+def _make_result(errors: Optional[List[str]],
+                 warnings: Optional[List[str]]) -> ValidationResult:
+    """
+    검증 결과 생성 (문제가 없으면 공유 결과 반환)
+    
+    Args:
+        errors: 에러 리스트 (없으면 None)
+        warnings: 경고 리스트 (없으면 None)
+        
+    Returns:
+        검증 결과
+    """
+    if errors is None and warnings is None:
+        return _VALID_RESULT
+    return ValidationResult(
+        is_valid=errors is None,
+        errors=errors or (),
+        warnings=warnings or ()
+    )
+
+
 class OrderValidator:
     """주문 검증 클래스"""
     
@@ -22,90 +105,103 @@ class OrderValidator:
         Returns:
             검증 결과
         """
-        errors = []
-        warnings = []
-        
         # 주문 아이템 존재 확인
         if not order.items:
-            errors.append("주문에 아이템이 없습니다")
-            return ValidationResult(is_valid=False, errors=errors)
+            return ValidationResult(is_valid=False, errors=("주문에 아이템이 없습니다",))
+        
+        errors: Optional[List[str]] = None
+        warnings: Optional[List[str]] = None
         
-        # 각 아이템 검증
-        for i, item in enumerate(order.items):
-            item_result = OrderValidator.validate_order_item(item)
-            if not item_result.is_valid:
-                errors.extend([f"아이템 {i+1}: {err}" for err in item_result.errors])
-            warnings.extend([f"아이템 {i+1}: {warn}" for warn in item_result.warnings])
+        # 중복을 제외한 메뉴를 한 번에 조회한 뒤 각 아이템 검증 (아이템별 결과 객체 생성 없이)
+        menus = menu_db.get_menus_by_ids({item.menu_id for item in order.items})
+        for i, item in enumerate(order.items, 1):
+            errors, warnings = OrderValidator._check_item(
+                item, menus.get(item.menu_id), errors, warnings, f"아이템 {i}: "
+            )
+        
+        total_price = order.total_price
+        item_count = order.item_count
         
         # 총 금액 검증
-        if order.total_price <= 0:
-            errors.append("총 금액이 0원 이하입니다")
+        if total_price <= 0:
+            errors = _append(errors, "총 금액이 0원 이하입니다")
         
         # 최대 금액 확인 (경고)
-        if order.total_price > 100000:
-            warnings.append(f"주문 금액이 매우 높습니다: {order.total_price:,}원")
+        if total_price > 100000:
+            warnings = _append(warnings, f"주문 금액이 매우 높습니다: {total_price:,}원")
         
         # 아이템 개수 확인 (경고)
-        if order.item_count > 20:
-            warnings.append(f"주문 아이템이 매우 많습니다: {order.item_count}개")
-        
-        is_valid = len(errors) == 0
+        if item_count > 20:
+            warnings = _append(warnings, f"주문 아이템이 매우 많습니다: {item_count}개")
         
-        return ValidationResult(
-            is_valid=is_valid,
-            errors=errors,
-            warnings=warnings
-        )
+        return _make_result(errors, warnings)
     
     @staticmethod
-    def validate_order_item(item: OrderItem) -> ValidationResult:
+    def validate_order_item(item: OrderItem,
+                            menu: Optional[MenuItem] = None) -> ValidationResult:
         """
         주문 아이템 검증
         
         Args:
             item: 검증할 주문 아이템
+            menu: 이미 조회한 아이템의 메뉴 (없으면 메뉴 DB에서 조회)
             
         Returns:
             검증 결과
         """
-        errors = []
-        warnings = []
+        if menu is None:
+            menu = menu_db.get_menu_by_id(item.menu_id)
+        
+        errors, warnings = OrderValidator._check_item(item, menu, None, None)
+        return _make_result(errors, warnings)
+    
+    @staticmethod
+    def _check_item(item: OrderItem, menu: Optional[MenuItem],
+                    errors: Optional[List[str]], warnings: Optional[List[str]],
+                    prefix: str = "") -> Tuple[Optional[List[str]], Optional[List[str]]]:
+        """
+        주문 아이템 검사 (문제가 있을 때만 리스트 생성)
         
+        Args:
+            item: 검증할 주문 아이템
+            menu: 아이템의 메뉴 (없으면 None)
+            errors: 기존 에러 리스트 (없으면 None)
+            warnings: 기존 경고 리스트 (없으면 None)
+            prefix: 메시지 앞에 붙일 문자열
+            
+        Returns:
+            (에러 리스트, 경고 리스트)
+        """
         # 메뉴 존재 확인
-        menu = menu_db.get_menu_by_id(item.menu_id)
         if not menu:
-            errors.append(f"메뉴 ID '{item.menu_id}'를 찾을 수 없습니다")
-            return ValidationResult(is_valid=False, errors=errors)
+            errors = _append(errors, f"{prefix}메뉴 ID '{item.menu_id}'를 찾을 수 없습니다")
+            return errors, warnings
         
         # 재고 확인
         if not menu.available:
-            errors.append(f"'{menu.name}'은(는) 현재 품절입니다")
+            errors = _append(errors, f"{prefix}'{menu.name}'은(는) 현재 품절입니다")
         
         # 수량 검증
         if item.quantity < 1:
-            errors.append("수량은 1 이상이어야 합니다")
+            errors = _append(errors, f"{prefix}수량은 1 이상이어야 합니다")
         elif item.quantity > 10:
-            warnings.append(f"수량이 많습니다: {item.quantity}개")
+            warnings = _append(warnings, f"{prefix}수량이 많습니다: {item.quantity}개")
         
         # 가격 검증
         if item.price != menu.price:
-            warnings.append(
-                f"가격 불일치: 아이템 가격 {item.price}원, "
+            warnings = _append(
+                warnings,
+                f"{prefix}가격 불일치: 아이템 가격 {item.price}원, "
                 f"메뉴 가격 {menu.price}원"
             )
         
         # 옵션 검증
+        menu_options = menu.options_set
         for option in item.options:
-            if option not in menu.options:
-                warnings.append(f"'{option}'은(는) 유효하지 않은 옵션입니다")
-        
-        is_valid = len(errors) == 0
+            if option not in menu_options:
+                warnings = _append(warnings, f"{prefix}'{option}'은(는) 유효하지 않은 옵션입니다")
         
-        return ValidationResult(
-            is_valid=is_valid,
-            errors=errors,
-            warnings=warnings
-        )
+        return errors, warnings
     
     @staticmethod
     def validate_menu_name(menu_name: str) -> ValidationResult:
@@ -118,27 +214,21 @@ class OrderValidator:
         Returns:
             검증 결과
         """
-        errors = []
-        warnings = []
-        
         if not menu_name or not menu_name.strip():
-            errors.append("메뉴 이름이 비어있습니다")
-            return ValidationResult(is_valid=False, errors=errors)
+            return ValidationResult(is_valid=False, errors=("메뉴 이름이 비어있습니다",))
         
         # 메뉴 존재 확인
         menu = menu_db.get_menu_by_name(menu_name)
         if not menu:
-            errors.append(f"'{menu_name}' 메뉴를 찾을 수 없습니다")
-        elif not menu.available:
-            errors.append(f"'{menu.name}'은(는) 현재 품절입니다")
-        
-        is_valid = len(errors) == 0
+            return ValidationResult(
+                is_valid=False, errors=(f"'{menu_name}' 메뉴를 찾을 수 없습니다",)
+            )
+        if not menu.available:
+            return ValidationResult(
+                is_valid=False, errors=(f"'{menu.name}'은(는) 현재 품절입니다",)
+            )
         
-        return ValidationResult(
-            is_valid=is_valid,
-            errors=errors,
-            warnings=warnings
-        )
+        return _VALID_RESULT
     
     @staticmethod
     def validate_quantity(quantity: int) -> ValidationResult:
@@ -151,23 +241,14 @@ class OrderValidator:
         Returns:
             검증 결과
         """
-        errors = []
-        warnings = []
-        
         if quantity < 1:
-            errors.append("수량은 1 이상이어야 합니다")
-        elif quantity > 99:
-            errors.append("수량은 99 이하여야 합니다")
-        elif quantity > 10:
-            warnings.append(f"수량이 많습니다: {quantity}개")
-        
-        is_valid = len(errors) == 0
-        
-        return ValidationResult(
-            is_valid=is_valid,
-            errors=errors,
-            warnings=warnings
-        )
+            return ValidationResult(is_valid=False, errors=("수량은 1 이상이어야 합니다",))
+        if quantity > 99:
+            return ValidationResult(is_valid=False, errors=("수량은 99 이하여야 합니다",))
+        if quantity > 10:
+            return ValidationResult(is_valid=True, warnings=(f"수량이 많습니다: {quantity}개",))
+        
+        return _VALID_RESULT
     
     @staticmethod
     def validate_user_input(user_input: str) -> ValidationResult:
@@ -180,31 +261,25 @@ class OrderValidator:
         Returns:
             검증 결과
         """
-        errors = []
-        warnings = []
-        
-        if not user_input or not user_input.strip():
-            errors.append("입력이 비어있습니다")
-            return ValidationResult(is_valid=False, errors=errors)
+        # 공백을 제거한 입력으로 이후 검사를 모두 수행
+        stripped = user_input.strip() if user_input else ""
+        if not stripped:
+            return ValidationResult(is_valid=False, errors=("입력이 비어있습니다",))
         
         # 입력 길이 확인
-        if len(user_input) > 500:
-            warnings.append("입력이 너무 깁니다")
+        warnings = ("입력이 너무 깁니다",) if len(stripped) > 500 else ()
         
         # 위험한 문자 확인 (보안)
-        dangerous_chars = ['<script>', 'javascript:', 'onerror=']
-        for char in dangerous_chars:
-            if char.lower() in user_input.lower():
-                errors.append("허용되지 않는 문자가 포함되어 있습니다")
-                break
-        
-        is_valid = len(errors) == 0
-        
-        return ValidationResult(
-            is_valid=is_valid,
-            errors=errors,
-            warnings=warnings
-        )
+        if _DANGEROUS_RE.search(stripped):
+            return ValidationResult(
+                is_valid=False,
+                errors=("허용되지 않는 문자가 포함되어 있습니다",),
+                warnings=warnings
+            )
+        
+        if warnings:
+            return ValidationResult(is_valid=True, warnings=warnings)
+        return _VALID_RESULT
 
 
 class InputSanitizer:
@@ -246,11 +321,9 @@ class InputSanitizer:
         Returns:
             추출된 숫자 (없으면 1)
         """
-        import re
-        numbers = re.findall(r'\d+', text)
-        if numbers:
-            return int(numbers[0])
-        return 1
+        # 첫 번째 숫자만 사용
+        match = _DIGIT_RE.search(text)
+        return int(match.group()) if match else 1
     
     @staticmethod
     def normalize_menu_name(name: str) -> str:
@@ -263,18 +336,35 @@ class InputSanitizer:
         Returns:
             정규화된 메뉴 이름
         """
-        # 공백 정제
-        name = InputSanitizer.sanitize_text(name)
-        
-        # 일반적인 표현 통일
-        replacements = {
-            "햄버거": "버거",
-            "감튀": "감자튀김",
-            "콜": "콜라",
-        }
-        
-        for old, new in replacements.items():
-            if old in name:
-                name = name.replace(old, new)
+        return normalize_menu_name(name)
+
+
+@lru_cache(maxsize=512)
+def normalize_menu_name(name: str) -> str:
+    """
+    메뉴 이름 정규화 (같은 이름은 캐시된 결과 반환)
+    
+    Args:
+        name: 메뉴 이름
+        
+    Returns:
+        정규화된 메뉴 이름
+    """
+    # 공백 정제
+    name = InputSanitizer.sanitize_text(name)
+    
+    # 일반적인 표현 통일 (한 번의 스캔으로 치환)
+    return _NORM_RE.sub(_replace_norm_match, name)
+
+
+def _replace_norm_match(match: "re.Match") -> str:
+    """
+    정규화 패턴 일치 항목의 대체 문자열 조회
+    
+    Args:
+        match: 정규식 일치 결과
         
-        return name
\ No newline at end of file
+    Returns:
+        대체 문자열
+    """
+    return _NORM_REPLACEMENTS[match.group(0)]